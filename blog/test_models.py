@@ -14,6 +14,7 @@ from core.factories import (
     UserFactory, BlogCategoryFactory, PostFactory, CommentFactory,
     NewsletterFactory, BlogSeriesFactory
 )
+from blog.models import BlogCategory, BlogSeries, Post, Comment, Newsletter
 
 User = get_user_model()
 
@@ -67,7 +68,6 @@ class BlogCategoryModelTests(BaseTestCase):
 
     def test_blog_category_meta_options(self):
         """Test BlogCategory model meta options"""
-        from blog.models import BlogCategory
         self.assertEqual(BlogCategory._meta.verbose_name_plural, 'Blog Categories')
         self.assertEqual(BlogCategory._meta.ordering, ['name'])
 
@@ -174,14 +174,14 @@ class PostModelTests(BaseTestCase, FileTestMixin):
 
     def test_post_meta_options(self):
         """Test Post model meta options"""
-        from blog.models import Post
         self.assertEqual(Post._meta.ordering, ['-created_at'])
 
     @override_media_root
     def test_post_featured_image_processing(self):
         """Test post featured image processing"""
-        post = PostFactory()
-        # Image processing is tested in the factory post_generation
+        post = PostFactory(with_image=True)
+        
+        self.assertTrue(post.featured_image)
 
 
 class CommentModelTests(BaseTestCase):
@@ -235,7 +235,6 @@ class CommentModelTests(BaseTestCase):
 
     def test_comment_meta_options(self):
         """Test Comment model meta options"""
-        from blog.models import Comment
         self.assertEqual(Comment._meta.ordering, ['created_at'])
 
     def test_comment_cascade_deletion(self):
@@ -246,7 +245,6 @@ class CommentModelTests(BaseTestCase):
         
         post.delete()
         
-        from blog.models import Comment
         with self.assertRaises(Comment.DoesNotExist):
             Comment.objects.get(id=comment_id)
 
@@ -296,7 +294,6 @@ class NewsletterModelTests(BaseTestCase):
 
     def test_newsletter_meta_options(self):
         """Test Newsletter model meta options"""
-        from blog.models import Newsletter
         self.assertEqual(Newsletter._meta.ordering, ['-subscribed_at'])
 
 
@@ -358,7 +355,6 @@ class BlogSeriesModelTests(BaseTestCase, FileTestMixin):
 
     def test_blog_series_meta_options(self):
         """Test BlogSeries model meta options"""
-        from blog.models import BlogSeries
         self.assertEqual(BlogSeries._meta.verbose_name_plural, 'Blog Series')
         self.assertEqual(BlogSeries._meta.ordering, ['-created_at'])
 
@@ -447,7 +443,6 @@ class BlogModelIntegrationTests(BaseTestCase):
         # Delete author should cascade to posts and comments
         author.delete()
         
-        from blog.models import Post, Comment
         
         with self.assertRaises(Post.DoesNotExist):
             Post.objects.get(id=post_id)
@@ -465,9 +460,8 @@ class BlogModelIntegrationTests(BaseTestCase):
         # Test deleting category sets posts category to NULL
         category.delete()
         
-        from blog.models import Post
         for post in posts:
-            post.refresh_from_db()
+            post.refresh_from_db(fields=['category'])
             self.assertIsNone(post.category)
 
     def test_newsletter_unique_subscription(self):
@@ -47,13 +47,10 @@ class ContactMessageAdmin(admin.ModelAdmin):
     actions = ['mark_as_read', 'mark_as_replied', 'mark_as_archived']
     
     def mark_as_read(self, request, queryset):
-        updated = 0
-        for message in queryset:
-            if message.status == 'new':
-                message.status = 'read'
-                message.read_at = timezone.now()
-                message.save()
-                updated += 1
+        updated = queryset.filter(status='new').update(
+            status='read',
+            read_at=timezone.now()
+        )
         self.message_user(request, f'{updated} messages marked as read.')
     mark_as_read.short_description = 'Mark selected messages as read'
     
@@ -0,0 +1,51 @@
+# Generated by Django 5.2.5 on 2026-10-14 14:20
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+SEARCH_VECTOR_SQL = """
+CREATE TRIGGER contact_contactmessage_search_vector_update
+    BEFORE INSERT OR UPDATE ON contact_contactmessage
+    FOR EACH ROW EXECUTE FUNCTION
+    tsvector_update_trigger(search_vector, 'pg_catalog.english', name, email, message);
+
+UPDATE contact_contactmessage SET search_vector = to_tsvector(
+    'pg_catalog.english',
+    coalesce(name, '') || ' ' || coalesce(email, '') || ' ' || coalesce(message, '')
+);
+
+CREATE INDEX contact_msg_search_gin ON contact_contactmessage USING gin (search_vector);
+"""
+
+REVERSE_SEARCH_VECTOR_SQL = """
+DROP INDEX IF EXISTS contact_msg_search_gin;
+DROP TRIGGER IF EXISTS contact_contactmessage_search_vector_update ON contact_contactmessage;
+"""
+
+
+def create_search_trigger(apps, schema_editor):
+    # Trigger and GIN index are PostgreSQL-only; other backends fall back to icontains
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(SEARCH_VECTOR_SQL)
+
+
+def drop_search_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(REVERSE_SEARCH_VECTOR_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contact', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contactmessage',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(create_search_trigger, drop_search_trigger),
+    ]
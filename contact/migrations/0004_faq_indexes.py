@@ -0,0 +1,21 @@
+# Generated by Django 5.2.5 on 2026-10-14 14:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contact', '0003_contactmessage_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='faq',
+            index=models.Index(fields=['is_featured', 'order'], name='contact_faq_is_feat_284bd2_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='faq',
+            index=models.Index(fields=['category', 'order'], name='contact_faq_categor_402a45_idx'),
+        ),
+    ]
@@ -1,5 +1,8 @@
 from django.db import models
+from django.db.models import Case, Count, F, Max, Q, Value, When
+from django.contrib.postgres.search import SearchVectorField
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.urls import reverse
 
 User = get_user_model()
@@ -69,6 +72,9 @@ class ContactMessage(models.Model):
     read_at = models.DateTimeField(null=True, blank=True)
     replied_at = models.DateTimeField(null=True, blank=True)
     
+    # Full-text search (kept up to date by a database trigger on PostgreSQL)
+    search_vector = SearchVectorField(null=True, editable=False)
+    
     class Meta:
         ordering = ['-created_at']
         indexes = [
@@ -86,12 +92,27 @@ class ContactMessage(models.Model):
             return self.subject_custom
         return self.get_subject_display()
     
+    @classmethod
+    def display_subject_expression(cls):
+        """Database-side equivalent of display_subject, for use in annotate()"""
+        return Case(
+            When(Q(subject='other') & ~Q(subject_custom=''), then=F('subject_custom')),
+            *[When(subject=value, then=Value(label)) for value, label in cls.SUBJECT_CHOICES],
+            default=F('subject'),
+            output_field=models.CharField(),
+        )
+    
     def mark_as_read(self):
         if self.status == 'new':
-            self.status = 'read'
             from django.utils import timezone
-            self.read_at = timezone.now()
-            self.save(update_fields=['status', 'read_at'])
+            read_at = timezone.now()
+            # Conditional UPDATE: no-op if another request already marked it read
+            updated = ContactMessage.objects.filter(pk=self.pk, status='new').update(
+                status='read', read_at=read_at
+            )
+            if updated:
+                self.status = 'read'
+                self.read_at = read_at
     
     def mark_as_replied(self):
         self.status = 'replied'
@@ -149,13 +170,49 @@ class FAQ(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    FEATURED_CACHE_KEY = 'contact_faqs_featured'
+    FEATURED_CACHE_TIMEOUT = 3600
+    VERSION_CACHE_KEY = 'faqs_v'
+    VERSION_CACHE_TIMEOUT = 60
+    
     class Meta:
         ordering = ['order', '-created_at']
+        indexes = [
+            models.Index(fields=['is_featured', 'order']),
+            models.Index(fields=['category', 'order']),
+        ]
         verbose_name = 'FAQ'
         verbose_name_plural = 'FAQs'
     
     def __str__(self):
         return self.question[:100]
+    
+    @classmethod
+    def get_featured(cls, limit=10):
+        """Featured FAQs (as dicts) for the contact page, cached until an FAQ changes"""
+        return cache.get_or_set(
+            cls.FEATURED_CACHE_KEY,
+            lambda: list(
+                cls.objects.filter(is_featured=True)
+                .order_by('order')
+                .values('id', 'question', 'answer', 'category')[:limit]
+            ),
+            cls.FEATURED_CACHE_TIMEOUT,
+        )
+    
+    @classmethod
+    def get_version(cls):
+        """
+        Version string for template fragment caches that render FAQs, e.g.
+        {% cache 3600 contact_featured_faqs faqs_version %}
+        """
+        def compute_version():
+            result = cls.objects.aggregate(count=Count('id'), last_updated=Max('updated_at'))
+            if result['last_updated'] is None:
+                return '0'
+            return f"{result['count']}-{result['last_updated'].timestamp()}"
+        
+        return cache.get_or_set(cls.VERSION_CACHE_KEY, compute_version, cls.VERSION_CACHE_TIMEOUT)
 
 
 class ContactInfo(models.Model):
@@ -203,9 +260,21 @@ class ContactInfo(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    ACTIVE_CACHE_KEY = 'contact_info_active'
+    ACTIVE_CACHE_TIMEOUT = 3600
+    
     class Meta:
         verbose_name = 'Contact Information'
         verbose_name_plural = 'Contact Information'
     
     def __str__(self):
         return self.business_name
+    
+    @classmethod
+    def get_active(cls):
+        """Active contact information, cached until a record changes"""
+        return cache.get_or_set(
+            cls.ACTIVE_CACHE_KEY,
+            lambda: cls.objects.filter(is_active=True).first(),
+            cls.ACTIVE_CACHE_TIMEOUT,
+        )
@@ -0,0 +1,20 @@
+"""
+Signal handlers for the contact app
+"""
+
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import ContactInfo, FAQ
+
+
+@receiver([post_save, post_delete], sender=ContactInfo)
+def invalidate_contact_info_cache(sender, **kwargs):
+    """Drop the cached active contact information when a record changes"""
+    cache.delete(ContactInfo.ACTIVE_CACHE_KEY)
+
+
+@receiver([post_save, post_delete], sender=FAQ)
+def invalidate_featured_faqs_cache(sender, **kwargs):
+    """Drop the cached featured FAQs and fragment version when an FAQ changes"""
+    cache.delete_many([FAQ.FEATURED_CACHE_KEY, FAQ.VERSION_CACHE_KEY])
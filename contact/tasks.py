@@ -0,0 +1,109 @@
+"""
+Background tasks for the contact app
+"""
+
+from functools import lru_cache
+from smtplib import SMTPServerDisconnected
+
+from celery import shared_task
+from django.core import mail
+from django.conf import settings
+from django.template import Context, Template
+from django.utils import timezone
+from .models import ContactMessage, ContactReply
+
+
+NOTIFICATION_EMAIL_TEMPLATE = """New contact message received:
+
+Name: {{ cm.name }}
+Email: {{ cm.email }}
+Subject: {{ cm.subject_display }}
+
+Message:
+{{ cm.message }}
+
+---
+View and reply: http://your-domain.com/admin/contact/messages/{{ cm.id }}/
+"""
+
+_connection = None
+
+
+@lru_cache(maxsize=None)
+def _notification_template():
+    """Compile the notification body template once per worker process"""
+    return Template(NOTIFICATION_EMAIL_TEMPLATE)
+
+
+def _get_connection():
+    """Return the worker's shared email connection, opening it on first use"""
+    global _connection
+    if _connection is None:
+        _connection = mail.get_connection()
+        _connection.open()
+    return _connection
+
+
+def _close_connection():
+    """Close and forget the shared connection so the next send reconnects"""
+    global _connection
+    if _connection is not None:
+        try:
+            _connection.close()
+        except Exception:
+            pass
+        _connection = None
+
+
+def _send(email):
+    """Send an email over the shared connection, reconnecting and retrying once if it was dropped"""
+    for attempt in range(2):
+        email.connection = _get_connection()
+        try:
+            email.send(fail_silently=False)
+            return
+        except (SMTPServerDisconnected, ConnectionError):
+            # The server dropped the idle connection; other errors are not retried
+            _close_connection()
+            if attempt:
+                raise
+
+
+@shared_task
+def send_notification_email_task(message_id):
+    """Send notification email to admin when new message is received"""
+    contact_message = ContactMessage.objects.filter(pk=message_id).annotate(
+        subject_display=ContactMessage.display_subject_expression()
+    ).values('id', 'name', 'email', 'message', 'subject_display').get()
+    
+    admin_email = getattr(settings, 'CONTACT_EMAIL', settings.DEFAULT_FROM_EMAIL)
+    body = _notification_template().render(
+        Context({'cm': contact_message}, autoescape=False)
+    )
+    
+    _send(mail.EmailMessage(
+        subject=f"New Contact Message: {contact_message['subject_display']}",
+        body=body,
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[admin_email],
+    ))
+
+
+@shared_task
+def send_reply_email_task(reply_id):
+    """Send reply email to the contact message sender and record delivery"""
+    reply = ContactReply.objects.select_related('contact_message').get(pk=reply_id)
+    contact_message = reply.contact_message
+    
+    _send(mail.EmailMessage(
+        subject=reply.subject,
+        body=reply.message,
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[contact_message.email],
+    ))
+    
+    reply.is_sent = True
+    reply.sent_at = timezone.now()
+    reply.save(update_fields=['is_sent', 'sent_at'])
+    
+    contact_message.mark_as_replied()
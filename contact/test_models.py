@@ -0,0 +1,140 @@
+"""
+Tests for Contact app models
+"""
+
+from django.core.cache import cache
+from django.test.utils import override_settings
+
+from core.test_utils import BaseTestCase
+from core.factories import ContactInfoFactory, ContactMessageFactory, FAQFactory
+from .models import ContactInfo, ContactMessage, FAQ
+
+LOCMEM_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+
+class ContactMessageModelTests(BaseTestCase):
+    """Test cases for ContactMessage model"""
+
+    def test_display_subject_expression_matches_property(self):
+        """Test that the annotated display subject matches display_subject"""
+        messages = [
+            ContactMessageFactory(subject='project'),
+            ContactMessageFactory(subject='other', subject_custom='Speaking request'),
+            ContactMessageFactory(subject='other', subject_custom=''),
+        ]
+        
+        annotated = dict(
+            ContactMessage.objects.annotate(
+                subject_display=ContactMessage.display_subject_expression()
+            ).values_list('pk', 'subject_display')
+        )
+        
+        for contact_message in messages:
+            self.assertEqual(annotated[contact_message.pk], contact_message.display_subject)
+
+    def test_mark_as_read_new_message(self):
+        """Test that a new message is marked read with a single UPDATE"""
+        contact_message = ContactMessageFactory(status='new')
+        
+        with self.assertNumQueries(1):
+            contact_message.mark_as_read()
+        
+        self.assertEqual(contact_message.status, 'read')
+        contact_message.refresh_from_db()
+        self.assertEqual(contact_message.status, 'read')
+        self.assertIsNotNone(contact_message.read_at)
+
+    def test_mark_as_read_already_read(self):
+        """Test that marking a read message as read does not write"""
+        contact_message = ContactMessageFactory(status='replied')
+        
+        with self.assertNumQueries(0):
+            contact_message.mark_as_read()
+        
+        self.assertEqual(contact_message.status, 'replied')
+        self.assertIsNone(contact_message.read_at)
+
+    def test_mark_as_read_stale_instance(self):
+        """Test that a stale instance does not overwrite a newer status"""
+        contact_message = ContactMessageFactory(status='new')
+        ContactMessage.objects.filter(pk=contact_message.pk).update(status='replied')
+        
+        contact_message.mark_as_read()
+        
+        self.assertEqual(contact_message.status, 'new')
+        contact_message.refresh_from_db()
+        self.assertEqual(contact_message.status, 'replied')
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class ContactInfoCacheTests(BaseTestCase):
+    """Test cases for cached ContactInfo lookup"""
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    def test_get_active_is_cached(self):
+        """Test that the active contact info is only queried once"""
+        contact_info = ContactInfoFactory()
+        
+        self.assertEqual(ContactInfo.get_active(), contact_info)
+        with self.assertNumQueries(0):
+            self.assertEqual(ContactInfo.get_active(), contact_info)
+
+    def test_save_invalidates_cache(self):
+        """Test that saving contact info refreshes the cached record"""
+        contact_info = ContactInfoFactory(business_name='Old Name')
+        ContactInfo.get_active()
+        
+        contact_info.business_name = 'New Name'
+        contact_info.save()
+        
+        self.assertEqual(ContactInfo.get_active().business_name, 'New Name')
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class FeaturedFAQCacheTests(BaseTestCase):
+    """Test cases for cached featured FAQs"""
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    def test_get_featured_is_cached(self):
+        """Test that featured FAQs are only queried once"""
+        FAQFactory.create_batch(2, is_featured=True)
+        FAQFactory(is_featured=False)
+        
+        faq = FAQ.objects.filter(is_featured=True).order_by('order').first()
+        featured = FAQ.get_featured()
+        self.assertEqual(len(featured), 2)
+        self.assertEqual(featured[0]['question'], faq.question)
+        with self.assertNumQueries(0):
+            self.assertEqual(len(FAQ.get_featured()), 2)
+
+    def test_delete_invalidates_cache(self):
+        """Test that deleting an FAQ refreshes the cached list"""
+        faq = FAQFactory(is_featured=True)
+        FAQ.get_featured()
+        
+        faq.delete()
+        
+        self.assertEqual(FAQ.get_featured(), [])
+
+    def test_version_changes_when_faq_changes(self):
+        """Test that the fragment cache version follows FAQ edits and deletes"""
+        faq = FAQFactory(is_featured=True)
+        FAQFactory(is_featured=True)
+        initial_version = FAQ.get_version()
+        
+        faq.delete()
+        after_delete = FAQ.get_version()
+        self.assertNotEqual(after_delete, initial_version)
+        
+        FAQ.objects.get().save()
+        self.assertNotEqual(FAQ.get_version(), after_delete)
@@ -0,0 +1,103 @@
+"""
+Tests for Contact app background tasks
+"""
+
+from smtplib import SMTPRecipientsRefused, SMTPServerDisconnected
+from unittest.mock import Mock, patch
+
+from django.core import mail
+
+from core.test_utils import BaseTestCase
+from core.factories import ContactMessageFactory, StaffUserFactory
+from .models import ContactReply
+from .tasks import send_notification_email_task, send_reply_email_task
+
+
+class SendNotificationEmailTaskTests(BaseTestCase):
+    """Test cases for send_notification_email_task"""
+
+    def test_notification_email_sent(self):
+        """Test that the task emails the admin about the message"""
+        contact_message = ContactMessageFactory(subject='project')
+        
+        send_notification_email_task.delay(contact_message.id)
+        
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertIn('Project Collaboration', mail.outbox[0].subject)
+        self.assertIn(contact_message.message, mail.outbox[0].body)
+
+    def test_notification_body_is_not_html_escaped(self):
+        """Test that the plain-text body keeps characters like & and < intact"""
+        contact_message = ContactMessageFactory(name='Tom & <Jerry>')
+        
+        send_notification_email_task.delay(contact_message.id)
+        
+        self.assertIn('Name: Tom & <Jerry>', mail.outbox[0].body)
+
+    def test_connection_opened_once_and_reused(self):
+        """Test that consecutive sends share one open connection"""
+        contact_message = ContactMessageFactory()
+        connection = Mock()
+        
+        with patch('contact.tasks._connection', None), \
+                patch('contact.tasks.mail.get_connection', return_value=connection) as get_connection:
+            send_notification_email_task.delay(contact_message.id)
+            send_notification_email_task.delay(contact_message.id)
+        
+        get_connection.assert_called_once()
+        connection.open.assert_called_once()
+        connection.close.assert_not_called()
+        self.assertEqual(connection.send_messages.call_count, 2)
+
+    def test_dropped_connection_reopened_and_retried_once(self):
+        """Test that a disconnected connection is closed, reopened and the send retried"""
+        contact_message = ContactMessageFactory()
+        dropped = Mock()
+        dropped.send_messages.side_effect = SMTPServerDisconnected
+        working = mail.get_connection()
+        
+        with patch('contact.tasks._connection', None), \
+                patch('contact.tasks.mail.get_connection', side_effect=[dropped, working]):
+            send_notification_email_task.delay(contact_message.id)
+        
+        dropped.close.assert_called_once()
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_other_send_errors_not_retried(self):
+        """Test that errors other than a dropped connection propagate on the first attempt"""
+        contact_message = ContactMessageFactory()
+        connection = Mock()
+        connection.send_messages.side_effect = SMTPRecipientsRefused({})
+        
+        with patch('contact.tasks._connection', None), \
+                patch('contact.tasks.mail.get_connection', return_value=connection) as get_connection:
+            with self.assertRaises(SMTPRecipientsRefused):
+                send_notification_email_task(contact_message.id)
+        
+        get_connection.assert_called_once()
+        connection.send_messages.assert_called_once()
+
+
+class SendReplyEmailTaskTests(BaseTestCase):
+    """Test cases for send_reply_email_task"""
+
+    def test_reply_email_sent_and_recorded(self):
+        """Test that the task emails the sender and marks the reply as sent"""
+        contact_message = ContactMessageFactory(email='visitor@example.com')
+        reply = ContactReply.objects.create(
+            contact_message=contact_message,
+            admin_user=StaffUserFactory(),
+            subject='Re: Hello',
+            message='Thanks for reaching out.'
+        )
+        
+        send_reply_email_task.delay(reply.id)
+        
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ['visitor@example.com'])
+        
+        reply.refresh_from_db()
+        contact_message.refresh_from_db()
+        self.assertTrue(reply.is_sent)
+        self.assertIsNotNone(reply.sent_at)
+        self.assertEqual(contact_message.status, 'replied')
@@ -0,0 +1,156 @@
+"""
+Tests for Contact app views
+"""
+
+import json
+from unittest.mock import patch
+
+from django.contrib.messages import get_messages
+from django.core import mail
+from django.urls import reverse
+
+from core.test_utils import BaseTestCase
+from core.factories import ContactMessageFactory, FAQFactory
+from .models import ContactMessage, ContactReply
+from .views import get_contact_message_stats, get_faq_categories
+
+
+class ContactMessageStatsTests(BaseTestCase):
+    """Test cases for the admin message statistics helper"""
+
+    def test_stats_counts_by_status(self):
+        """Test that stats are counted per status in one query"""
+        ContactMessageFactory.create_batch(3, status='new')
+        ContactMessageFactory.create_batch(2, status='read')
+        ContactMessageFactory(status='replied')
+        ContactMessageFactory(status='archived')
+        
+        with self.assertNumQueries(1):
+            stats = get_contact_message_stats()
+        
+        self.assertEqual(stats, {'total': 7, 'new': 3, 'read': 2, 'replied': 1})
+
+
+class FAQCategoriesTests(BaseTestCase):
+    """Test cases for the FAQ grouping helper"""
+
+    def test_faqs_grouped_by_category_in_order(self):
+        """Test that FAQs are grouped per category and sorted by order"""
+        FAQFactory(category='pricing', question='Second', order=2)
+        FAQFactory(category='pricing', question='First', order=1)
+        FAQFactory(category='general', question='Hello', order=1)
+        
+        with self.assertNumQueries(1):
+            faq_categories = get_faq_categories()
+        
+        self.assertEqual(list(faq_categories), ['general', 'pricing'])
+        self.assertEqual(
+            [faq['question'] for faq in faq_categories['pricing']],
+            ['First', 'Second']
+        )
+
+    def test_faqs_filtered_by_category(self):
+        """Test that only the requested category is returned"""
+        FAQFactory(category='pricing')
+        FAQFactory(category='general')
+        
+        self.assertEqual(list(get_faq_categories('general')), ['general'])
+
+
+class QuickContactViewTests(BaseTestCase):
+    """Test cases for the quick contact AJAX endpoint"""
+
+    def setUp(self):
+        super().setUp()
+        self.url = reverse('contact:quick_contact')
+        self.data = {
+            'name': 'Quick Contact',
+            'email': 'quick@example.com',
+            'message': 'Hello there!'
+        }
+
+    def test_quick_contact_form_encoded_post(self):
+        """Test creating a message from a form-encoded POST"""
+        response = self.client.post(self.url, data=self.data)
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()['success'])
+        self.assertTrue(ContactMessage.objects.filter(email='quick@example.com').exists())
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_quick_contact_logs_queue_failure(self):
+        """Test that a failed enqueue is logged and the message is still saved"""
+        with patch('contact.views.send_notification_email_task.delay', side_effect=OSError('broker down')):
+            with self.assertLogs('contact.views', level='ERROR') as logs:
+                response = self.client.post(self.url, data=self.data)
+        
+        self.assertTrue(response.json()['success'])
+        self.assertIn('Failed to queue notification email', logs.output[0])
+        self.assertTrue(ContactMessage.objects.filter(email='quick@example.com').exists())
+
+    def test_quick_contact_json_post(self):
+        """Test creating a message from a JSON POST"""
+        response = self.client.post(
+            self.url, data=json.dumps(self.data), content_type='application/json'
+        )
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()['success'])
+        self.assertTrue(ContactMessage.objects.filter(email='quick@example.com').exists())
+
+    def test_quick_contact_invalid_data(self):
+        """Test validation errors are returned per field"""
+        response = self.client.post(self.url, data={'name': 'x' * 101, 'email': 'invalid-email'})
+        
+        data = response.json()
+        self.assertFalse(data['success'])
+        self.assertEqual(set(data['errors']), {'name', 'email', 'message'})
+        self.assertFalse(ContactMessage.objects.exists())
+
+    def test_quick_contact_malformed_json(self):
+        """Test that a malformed JSON body is rejected"""
+        response = self.client.post(self.url, data='{not json', content_type='application/json')
+        
+        self.assertEqual(response.status_code, 400)
+
+    def test_quick_contact_get_not_allowed(self):
+        """Test that GET requests are rejected"""
+        response = self.client.get(self.url)
+        
+        self.assertEqual(response.status_code, 405)
+
+
+class AdminMessageReplyTests(BaseTestCase):
+    """Test cases for replying from the admin message detail view"""
+
+    def setUp(self):
+        super().setUp()
+        self.contact_message = ContactMessageFactory()
+        self.url = reverse(
+            'contact:admin_message_detail', kwargs={'message_id': self.contact_message.id}
+        )
+        self.data = {'subject': 'Re: Hello', 'message': 'Thanks for reaching out.'}
+        self.login_user(self.staff_user)
+
+    def test_reply_reported_as_queued(self):
+        """Test that the admin is told the reply was queued, not sent"""
+        response = self.client.post(self.url, data=self.data)
+        
+        self.assertRedirects(response, self.url, fetch_redirect_response=False)
+        self.assertEqual(
+            [str(message) for message in get_messages(response.wsgi_request)],
+            ['Reply queued for sending.']
+        )
+
+    def test_reply_queue_failure_reported_and_logged(self):
+        """Test that a failed enqueue keeps the reply and says the dispatch failed"""
+        with patch('contact.views.send_reply_email_task.delay', side_effect=OSError('broker down')):
+            with self.assertLogs('contact.views', level='ERROR') as logs:
+                response = self.client.post(self.url, data=self.data)
+        
+        self.assertIn('Failed to queue reply email', logs.output[0])
+        self.assertEqual(
+            [str(message) for message in get_messages(response.wsgi_request)],
+            ['The reply was saved, but queueing it for sending failed.']
+        )
+        self.assertTrue(ContactReply.objects.filter(contact_message=self.contact_message).exists())
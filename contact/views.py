@@ -1,12 +1,31 @@
+import json
+import logging
+from itertools import groupby
+from operator import itemgetter
+
 from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib import messages
-from django.core.mail import send_mail
-from django.conf import settings
 from django.contrib.admin.views.decorators import staff_member_required
 from django.http import JsonResponse
-from django.core.paginator import Paginator
+from django.views.decorators.http import require_POST
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Count, F, Prefetch, Q
+from django.db.models.functions import JSONObject
+from django.contrib.postgres.aggregates import JSONBAgg
+from django.contrib.postgres.search import SearchQuery
+from core.paginator import CachedCountPaginator
 from .models import ContactMessage, ContactInfo, FAQ, ContactReply
-from .forms import ContactForm, QuickContactForm, ContactReplyForm
+from .forms import ContactForm, ContactReplyForm
+from .tasks import send_notification_email_task, send_reply_email_task
+
+logger = logging.getLogger(__name__)
+
+CONTACT_MESSAGE_STATS_CACHE_KEY = 'contact_msg_stats'
+CONTACT_MESSAGE_STATS_CACHE_TIMEOUT = 30
+QUICK_CONTACT_NAME_MAX_LENGTH = ContactMessage._meta.get_field('name').max_length
 
 
 def contact(request):
@@ -22,11 +41,11 @@ def contact(request):
             
             contact_message.save()
             
-            # Send notification email to admin
+            # Queue notification email to admin
             try:
-                send_notification_email(contact_message)
-            except Exception as e:
-                print(f"Failed to send notification email: {e}")
+                send_notification_email_task.delay(contact_message.id)
+            except Exception:
+                logger.exception("Failed to queue notification email for message %s", contact_message.id)
             
             messages.success(
                 request, 
@@ -37,15 +56,15 @@ def contact(request):
         form = ContactForm()
     
     # Get contact information
-    contact_info = ContactInfo.objects.filter(is_active=True).first()
-    
-    # Get FAQs
-    faqs = FAQ.objects.filter(is_featured=True).order_by('order')[:10]
+    contact_info = ContactInfo.get_active()
     
+    # FAQs are passed as a callable so a cached template fragment
+    # ({% cache 3600 contact_featured_faqs faqs_version %}) skips the lookup
     context = {
         'form': form,
         'contact_info': contact_info,
-        'faqs': faqs,
+        'faqs': FAQ.get_featured,
+        'faqs_version': FAQ.get_version(),
     }
     return render(request, 'contact/contact.html', context)
 
@@ -55,56 +74,80 @@ def contact_success(request):
     return render(request, 'contact/success.html')
 
 
+def clean_quick_contact(data):
+    """Validate quick contact input without a Django form, returning (cleaned_data, errors)"""
+    cleaned_data = {}
+    errors = {}
+    
+    for field_name in ('name', 'email', 'message'):
+        value = data.get(field_name, '')
+        cleaned_data[field_name] = value.strip() if isinstance(value, str) else ''
+        if not cleaned_data[field_name]:
+            errors[field_name] = ['This field is required.']
+    
+    name = cleaned_data['name']
+    if len(name) > QUICK_CONTACT_NAME_MAX_LENGTH:
+        errors['name'] = [
+            f'Ensure this value has at most {QUICK_CONTACT_NAME_MAX_LENGTH} characters '
+            f'(it has {len(name)}).'
+        ]
+    
+    if cleaned_data['email']:
+        try:
+            validate_email(cleaned_data['email'])
+        except ValidationError as e:
+            errors['email'] = e.messages
+    
+    return cleaned_data, errors
+
+
+@require_POST
 def quick_contact(request):
-    """AJAX endpoint for quick contact form"""
-    if request.method == 'POST':
-        form = QuickContactForm(request.POST)
-        if form.is_valid():
-            # Create ContactMessage from quick form
-            contact_message = ContactMessage.objects.create(
-                name=form.cleaned_data['name'],
-                email=form.cleaned_data['email'],
-                message=form.cleaned_data['message'],
-                subject='general',
-                ip_address=request.META.get('REMOTE_ADDR'),
-                user_agent=request.META.get('HTTP_USER_AGENT', '')
-            )
-            
-            # Send notification
-            try:
-                send_notification_email(contact_message)
-            except Exception as e:
-                print(f"Failed to send notification email: {e}")
-            
-            return JsonResponse({
-                'success': True,
-                'message': 'Thank you! Your message has been sent successfully.'
-            })
-        else:
-            return JsonResponse({
-                'success': False,
-                'errors': form.errors
-            })
+    """AJAX endpoint for quick contact form (JSON or form-encoded body)"""
+    if request.content_type == 'application/json':
+        try:
+            data = json.loads(request.body)
+        except ValueError:
+            data = None
+        if not isinstance(data, dict):
+            return JsonResponse({'success': False, 'message': 'Invalid JSON body'}, status=400)
+    else:
+        data = request.POST
+    
+    cleaned_data, errors = clean_quick_contact(data)
+    if errors:
+        return JsonResponse({
+            'success': False,
+            'errors': errors
+        })
     
-    return JsonResponse({'success': False, 'message': 'Invalid request method'})
+    # Create ContactMessage from quick form
+    contact_message = ContactMessage.objects.create(
+        name=cleaned_data['name'],
+        email=cleaned_data['email'],
+        message=cleaned_data['message'],
+        subject='general',
+        ip_address=request.META.get('REMOTE_ADDR'),
+        user_agent=request.META.get('HTTP_USER_AGENT', '')
+    )
+    
+    # Queue notification
+    try:
+        send_notification_email_task.delay(contact_message.id)
+    except Exception:
+        logger.exception("Failed to queue notification email for message %s", contact_message.id)
+    
+    return JsonResponse({
+        'success': True,
+        'message': 'Thank you! Your message has been sent successfully.'
+    })
 
 
 def faq_list(request):
     """FAQ listing page"""
     category = request.GET.get('category', '')
     
-    faqs = FAQ.objects.all()
-    if category:
-        faqs = faqs.filter(category=category)
-    
-    faqs = faqs.order_by('order', '-created_at')
-    
-    # Group FAQs by category
-    faq_categories = {}
-    for faq in faqs:
-        if faq.category not in faq_categories:
-            faq_categories[faq.category] = []
-        faq_categories[faq.category].append(faq)
+    faq_categories = get_faq_categories(category)
     
     context = {
         'faq_categories': faq_categories,
@@ -114,6 +157,41 @@ def faq_list(request):
     return render(request, 'contact/faq.html', context)
 
 
+def get_faq_categories(category=''):
+    """Map each category (alphabetically) to its FAQs as question/answer dicts in display order"""
+    faqs = FAQ.objects.all()
+    if category:
+        faqs = faqs.filter(category=category)
+    
+    if connection.vendor == 'postgresql':
+        # Let Postgres build one JSON array per category instead of grouping rows here
+        rows = faqs.order_by('category').values('category').annotate(
+            items=JSONBAgg(
+                JSONObject(question=F('question'), answer=F('answer')),
+                order_by=('order', '-created_at'),
+            )
+        )
+        return {row['category']: row['items'] for row in rows}
+    
+    rows = faqs.order_by('category', 'order', '-created_at').values(
+        'category', 'question', 'answer'
+    )
+    return {
+        key: [{'question': row['question'], 'answer': row['answer']} for row in group]
+        for key, group in groupby(rows.iterator(chunk_size=500), key=itemgetter('category'))
+    }
+
+
+def get_contact_message_stats():
+    """Count messages per status in a single query"""
+    return ContactMessage.objects.aggregate(
+        total=Count('id'),
+        new=Count('id', filter=Q(status='new')),
+        read=Count('id', filter=Q(status='read')),
+        replied=Count('id', filter=Q(status='replied')),
+    )
+
+
 @staff_member_required
 def admin_messages(request):
     """Admin view to manage contact messages"""
@@ -126,25 +204,32 @@ def admin_messages(request):
         messages_queryset = messages_queryset.filter(status=status)
     
     if search:
-        messages_queryset = messages_queryset.filter(
-            models.Q(name__icontains=search) |
-            models.Q(email__icontains=search) |
-            models.Q(message__icontains=search)
-        )
+        if connection.vendor == 'postgresql':
+            # Single GIN index probe on the trigger-maintained search vector
+            messages_queryset = messages_queryset.filter(
+                search_vector=SearchQuery(search, config='english', search_type='websearch')
+            )
+        else:
+            messages_queryset = messages_queryset.filter(
+                Q(name__icontains=search) |
+                Q(email__icontains=search) |
+                Q(message__icontains=search)
+            )
     
-    messages_queryset = messages_queryset.order_by('-created_at')
+    messages_queryset = messages_queryset.only(
+        'id', 'name', 'email', 'subject', 'subject_custom', 'status', 'priority', 'created_at'
+    ).order_by('-created_at')
     
-    paginator = Paginator(messages_queryset, 20)
+    paginator = CachedCountPaginator(messages_queryset, 20, cache_prefix='cm_count')
     page_number = request.GET.get('page')
     page_obj = paginator.get_page(page_number)
     
-    # Get statistics
-    stats = {
-        'total': ContactMessage.objects.count(),
-        'new': ContactMessage.objects.filter(status='new').count(),
-        'read': ContactMessage.objects.filter(status='read').count(),
-        'replied': ContactMessage.objects.filter(status='replied').count(),
-    }
+    # Get statistics (one conditional aggregate, cached briefly)
+    stats = cache.get_or_set(
+        CONTACT_MESSAGE_STATS_CACHE_KEY,
+        get_contact_message_stats,
+        CONTACT_MESSAGE_STATS_CACHE_TIMEOUT,
+    )
     
     context = {
         'page_obj': page_obj,
@@ -159,7 +244,14 @@ def admin_messages(request):
 @staff_member_required
 def admin_message_detail(request, message_id):
     """Admin view for individual message details and reply"""
-    contact_message = get_object_or_404(ContactMessage, id=message_id)
+    replies = ContactReply.objects.select_related('admin_user').only(
+        'id', 'contact_message_id', 'subject', 'message', 'is_sent', 'sent_at', 'created_at',
+        'admin_user__username', 'admin_user__email',
+    ).order_by('-created_at')
+    contact_message = get_object_or_404(
+        ContactMessage.objects.prefetch_related(Prefetch('replies', queryset=replies)),
+        id=message_id
+    )
     contact_message.mark_as_read()
     
     if request.method == 'POST':
@@ -170,18 +262,13 @@ def admin_message_detail(request, message_id):
             reply.admin_user = request.user
             reply.save()
             
-            # Send reply email
+            # Queue reply email; the task marks the reply as sent
             try:
-                send_reply_email(reply)
-                reply.is_sent = True
-                reply.sent_at = timezone.now()
-                reply.save()
-                
-                contact_message.mark_as_replied()
-                
-                messages.success(request, 'Reply sent successfully!')
-            except Exception as e:
-                messages.error(request, f'Failed to send reply: {e}')
+                send_reply_email_task.delay(reply.id)
+                messages.success(request, 'Reply queued for sending.')
+            except Exception:
+                logger.exception("Failed to queue reply email for reply %s", reply.id)
+                messages.error(request, 'The reply was saved, but queueing it for sending failed.')
             
             return redirect('contact:admin_message_detail', message_id=message_id)
     else:
@@ -196,43 +283,3 @@ def admin_message_detail(request, message_id):
     }
     return render(request, 'contact/admin_message_detail.html', context)
 
-
-def send_notification_email(contact_message):
-    """Send notification email to admin when new message is received"""
-    subject = f"New Contact Message: {contact_message.display_subject}"
-    message = f"""
-    New contact message received:
-    
-    Name: {contact_message.name}
-    Email: {contact_message.email}
-    Subject: {contact_message.display_subject}
-    
-    Message:
-    {contact_message.message}
-    
-    ---
-    View and reply: http://your-domain.com/admin/contact/messages/{contact_message.id}/
-    """
-    
-    admin_email = getattr(settings, 'CONTACT_EMAIL', settings.DEFAULT_FROM_EMAIL)
-    
-    send_mail(
-        subject=subject,
-        message=message,
-        from_email=settings.DEFAULT_FROM_EMAIL,
-        recipient_list=[admin_email],
-        fail_silently=False,
-    )
-
-
-def send_reply_email(reply):
-    """Send reply email to the contact message sender"""
-    contact_message = reply.contact_message
-    
-    send_mail(
-        subject=reply.subject,
-        message=reply.message,
-        from_email=settings.DEFAULT_FROM_EMAIL,
-        recipient_list=[contact_message.email],
-        fail_silently=False,
-    )
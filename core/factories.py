@@ -6,18 +6,32 @@ import factory
 from factory.django import DjangoModelFactory
 from factory import Faker, SubFactory, LazyAttribute
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import MD5PasswordHasher
 from django.core.files.base import ContentFile
 from PIL import Image
+import functools
 import io
 
 User = get_user_model()
 
+TEST_PASSWORD = 'testpass123'
+# Hashed with MD5 so it verifies under the fast hashers used by the test base classes
+TEST_PASSWORD_HASH = MD5PasswordHasher().encode(TEST_PASSWORD, MD5PasswordHasher().salt())
+
+# Set to True to leave image fields empty instead of attaching test images;
+# factories with an image field take with_image=True to attach one regardless
+FAST_FACTORIES_SKIP_IMAGES = False
+
+# Faker's phone_number can run past the 20-character phone columns and fail form validation
+PHONE_NUMBER_FORMAT = '+1##########'
+
 
 class UserFactory(DjangoModelFactory):
     """Factory for creating User instances"""
     
     class Meta:
         model = User
+        skip_postgeneration_save = True
     
     username = factory.Sequence(lambda n: f"user{n}")
     email = factory.LazyAttribute(lambda obj: f"{obj.username}@example.com")
@@ -29,15 +43,18 @@ class UserFactory(DjangoModelFactory):
     github = factory.LazyAttribute(lambda obj: f"https://github.com/{obj.username}")
     linkedin = factory.LazyAttribute(lambda obj: f"https://linkedin.com/in/{obj.username}")
     twitter = factory.LazyAttribute(lambda obj: f"https://twitter.com/{obj.username}")
+    password = TEST_PASSWORD_HASH
     is_verified = False
     is_active = True
 
     @factory.post_generation
     def set_password(obj, create, extracted, **kwargs):
-        """Set a default password for the user"""
-        if create:
-            obj.set_password('testpass123')
-            obj.save()
+        """Hash a custom password passed as set_password='...'"""
+        # The default password is already assigned as TEST_PASSWORD_HASH
+        if extracted:
+            obj.set_password(extracted)
+            if create:
+                obj.save(update_fields=['password'])
 
 
 class StaffUserFactory(UserFactory):
@@ -51,6 +68,18 @@ class SuperUserFactory(UserFactory):
     is_superuser = True
 
 
+class FastUserFactory(UserFactory):
+    """UserFactory without Faker calls, for seeding many users"""
+    first_name = "Test"
+    last_name = factory.LazyAttribute(lambda obj: obj.username.title())
+    bio = ""
+    location = ""
+    website = ""
+    github = ""
+    linkedin = ""
+    twitter = ""
+
+
 class ProfileFactory(DjangoModelFactory):
     """Factory for creating Profile instances"""
     
@@ -58,7 +87,7 @@ class ProfileFactory(DjangoModelFactory):
         model = 'users.Profile'
     
     user = SubFactory(UserFactory)
-    phone = Faker('phone_number')
+    phone = Faker('numerify', text=PHONE_NUMBER_FORMAT)
     date_of_birth = Faker('date_of_birth', minimum_age=18, maximum_age=65)
     company = Faker('company')
     position = Faker('job')
@@ -67,13 +96,39 @@ class ProfileFactory(DjangoModelFactory):
     hourly_rate = Faker('pydecimal', left_digits=3, right_digits=2, positive=True, min_value=25, max_value=200)
 
 
-def create_test_image(width=100, height=100, color='RGB', format_name='PNG'):
-    """Create a test image for upload fields"""
+def bulk_create_factory(factory_cls, size, batch_size=500, **kwargs):
+    """
+    Build objects in memory and insert them with multi-row INSERTs.
+    post_generation hooks do not run, and related objects must already be
+    saved and passed in kwargs (e.g. user=user).
+    """
+    objs = factory_cls.build_batch(size, **kwargs)
+    model = factory_cls._meta.get_model_class()
+    return model.objects.bulk_create(objs, batch_size=batch_size)
+
+
+@functools.lru_cache(maxsize=16)
+def _encoded_test_image(width, height, color, format_name):
+    """Encode a solid red test image once per size/mode/format"""
     image = Image.new(color, (width, height), color='red')
     image_io = io.BytesIO()
     image.save(image_io, format=format_name)
-    image_io.seek(0)
-    return ContentFile(image_io.getvalue(), name=f'test_image.{format_name.lower()}')
+    return image_io.getvalue()
+
+
+def create_test_image(width=100, height=100, color='RGB', format_name='PNG'):
+    """Create a test image for upload fields"""
+    return ContentFile(
+        _encoded_test_image(width, height, color, format_name),
+        name=f'test_image.{format_name.lower()}'
+    )
+
+
+def default_test_image():
+    """Test image for factory image fields, or blank when images are skipped"""
+    if FAST_FACTORIES_SKIP_IMAGES:
+        return ''
+    return create_test_image()
 
 
 class CategoryFactory(DjangoModelFactory):
@@ -95,6 +150,9 @@ class ProjectFactory(DjangoModelFactory):
     class Meta:
         model = 'portfolio.Project'
     
+    class Params:
+        with_image = factory.Trait(featured_image=factory.LazyFunction(create_test_image))
+    
     title = Faker('sentence', nb_words=4)
     slug = factory.LazyAttribute(lambda obj: obj.title.lower().replace(' ', '-'))
     description = Faker('paragraph', nb_sentences=10)
@@ -112,12 +170,27 @@ class ProjectFactory(DjangoModelFactory):
     is_featured = False
     is_published = True
     views = Faker('pyint', min_value=0, max_value=1000)
-
-    @factory.post_generation
-    def featured_image(obj, create, extracted, **kwargs):
-        if create:
-            obj.featured_image = create_test_image()
-            obj.save()
+    featured_image = factory.LazyFunction(default_test_image)
+
+
+def seed_projects(project_count=1000, user_count=50, category_count=10):
+    """
+    Create projects that share a small pool of users and categories instead
+    of one new user and category per project (as SubFactory would).
+    """
+    users = UserFactory.create_batch(user_count)
+    categories = CategoryFactory.create_batch(
+        category_count,
+        name=factory.Sequence(lambda n: f"Seed Category {n}"),
+        slug=factory.Sequence(lambda n: f"seed-category-{n}"),
+    )
+    projects = ProjectFactory.create_batch(
+        project_count,
+        slug=factory.Sequence(lambda n: f"seed-project-{n}"),
+        user=factory.Iterator(users),
+        category=factory.Iterator(categories),
+    )
+    return users, categories, projects
 
 
 class SkillFactory(DjangoModelFactory):
@@ -181,6 +254,9 @@ class AchievementFactory(DjangoModelFactory):
     class Meta:
         model = 'portfolio.Achievement'
     
+    class Params:
+        with_image = factory.Trait(image=factory.LazyFunction(create_test_image))
+    
     user = SubFactory(UserFactory)
     title = Faker('sentence', nb_words=6)
     description = Faker('paragraph')
@@ -188,12 +264,7 @@ class AchievementFactory(DjangoModelFactory):
     date_received = Faker('date_between', start_date='-2y', end_date='today')
     credential_id = Faker('uuid4')
     credential_url = Faker('url')
-
-    @factory.post_generation
-    def image(obj, create, extracted, **kwargs):
-        if create:
-            obj.image = create_test_image()
-            obj.save()
+    image = factory.LazyFunction(default_test_image)
 
 
 class TestimonialFactory(DjangoModelFactory):
@@ -202,6 +273,9 @@ class TestimonialFactory(DjangoModelFactory):
     class Meta:
         model = 'portfolio.Testimonial'
     
+    class Params:
+        with_image = factory.Trait(client_image=factory.LazyFunction(create_test_image))
+    
     user = SubFactory(UserFactory)
     client_name = Faker('name')
     client_position = Faker('job')
@@ -210,12 +284,7 @@ class TestimonialFactory(DjangoModelFactory):
     rating = Faker('pyint', min_value=1, max_value=5)
     project = SubFactory(ProjectFactory)
     is_featured = False
-
-    @factory.post_generation
-    def client_image(obj, create, extracted, **kwargs):
-        if create:
-            obj.client_image = create_test_image()
-            obj.save()
+    client_image = factory.LazyFunction(default_test_image)
 
 
 class BlogCategoryFactory(DjangoModelFactory):
@@ -236,17 +305,15 @@ class BlogSeriesFactory(DjangoModelFactory):
     class Meta:
         model = 'blog.BlogSeries'
     
+    class Params:
+        with_image = factory.Trait(image=factory.LazyFunction(create_test_image))
+    
     title = Faker('sentence', nb_words=5)
     slug = factory.LazyAttribute(lambda obj: obj.title.lower().replace(' ', '-'))
     description = Faker('paragraph')
     author = SubFactory(UserFactory)
     is_completed = False
-
-    @factory.post_generation
-    def image(obj, create, extracted, **kwargs):
-        if create:
-            obj.image = create_test_image()
-            obj.save()
+    image = factory.LazyFunction(default_test_image)
 
 
 class PostFactory(DjangoModelFactory):
@@ -255,6 +322,9 @@ class PostFactory(DjangoModelFactory):
     class Meta:
         model = 'blog.Post'
     
+    class Params:
+        with_image = factory.Trait(featured_image=factory.LazyFunction(create_test_image))
+    
     title = Faker('sentence', nb_words=8)
     slug = factory.LazyAttribute(lambda obj: obj.title.lower().replace(' ', '-'))
     author = SubFactory(UserFactory)
@@ -268,12 +338,7 @@ class PostFactory(DjangoModelFactory):
     meta_description = factory.LazyAttribute(lambda obj: obj.excerpt[:160])
     views = Faker('pyint', min_value=0, max_value=1000)
     published_at = Faker('date_time_between', start_date='-1y', end_date='now')
-
-    @factory.post_generation
-    def featured_image(obj, create, extracted, **kwargs):
-        if create:
-            obj.featured_image = create_test_image()
-            obj.save()
+    featured_image = factory.LazyFunction(default_test_image)
 
 
 class CommentFactory(DjangoModelFactory):
@@ -307,7 +372,7 @@ class ContactMessageFactory(DjangoModelFactory):
     
     name = Faker('name')
     email = Faker('email')
-    phone = Faker('phone_number')
+    phone = Faker('numerify', text=PHONE_NUMBER_FORMAT)
     company = Faker('company')
     website = Faker('url')
     subject = factory.Iterator(['general', 'project', 'freelance', 'support', 'partnership'])
@@ -343,7 +408,7 @@ class ContactInfoFactory(DjangoModelFactory):
     tagline = "Showcase your work professionally"
     description = Faker('paragraph')
     email = "contact@portfolioplatform.com"
-    phone = Faker('phone_number')
+    phone = Faker('numerify', text=PHONE_NUMBER_FORMAT)
     address = Faker('address')
     website = "https://portfolioplatform.com"
     linkedin = "https://linkedin.com/company/portfolio-platform"
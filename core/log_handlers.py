@@ -0,0 +1,21 @@
+"""
+Logging handlers shared across apps
+"""
+
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+
+class QueueStreamHandler(QueueHandler):
+    """
+    Format records on the calling thread and write them to a stream from a
+    background listener thread, so request threads never block on I/O.
+    """
+    
+    def __init__(self, stream=None):
+        super().__init__(queue.SimpleQueue())
+        self.listener = QueueListener(self.queue, logging.StreamHandler(stream))
+        self.listener.start()
+        atexit.register(self.listener.stop)
@@ -0,0 +1,68 @@
+"""
+Paginator classes shared across apps
+"""
+
+import hashlib
+import json
+
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+
+class CachedCountPaginator(Paginator):
+    """Paginator that caches the total object count for a short time"""
+    
+    def __init__(self, object_list, per_page, cache_timeout=30, cache_prefix='paginator_count', **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.cache_timeout = cache_timeout
+        self.cache_prefix = cache_prefix
+    
+    @cached_property
+    def count(self):
+        query = getattr(self.object_list, 'query', None)
+        if query is None:
+            return super().count
+        
+        # Key on the compiled SQL so each filter combination gets its own count
+        sql, params = query.sql_with_params()
+        digest = hashlib.md5(f'{sql}{params}'.encode(), usedforsecurity=False).hexdigest()
+        return cache.get_or_set(
+            f'{self.cache_prefix}:{digest}',
+            lambda: super(CachedCountPaginator, self).count,
+            self.cache_timeout,
+        )
+
+
+class ApproxCountPaginator(Paginator):
+    """Paginator that uses the PostgreSQL planner's row estimate for large result sets"""
+    
+    # Estimates below this are replaced by an exact COUNT(*), which is cheap at that size
+    exact_count_threshold = 1000
+    
+    @cached_property
+    def count(self):
+        query = getattr(self.object_list, 'query', None)
+        if query is None:
+            return super().count
+        
+        connection = connections[self.object_list.db]
+        if connection.vendor != 'postgresql':
+            return super().count
+        
+        sql, params = query.get_compiler(connection=connection).as_sql()
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        
+        estimate = int(plan[0]['Plan']['Plan Rows'])
+        if estimate < self.exact_count_threshold:
+            return super().count
+        return estimate
+
+
+class CachedApproxCountPaginator(CachedCountPaginator, ApproxCountPaginator):
+    """CachedCountPaginator that fills cache misses with ApproxCountPaginator's count"""
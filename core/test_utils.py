@@ -2,55 +2,140 @@
 Base test classes and utility functions for all test suites
 """
 
-from django.test import TestCase, TransactionTestCase, Client
-from django.test.utils import override_settings
+from django.test import TestCase, Client
+from django.test.utils import CaptureQueriesContext, override_settings
 from django.contrib.auth import get_user_model
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.urls import reverse
 from django.contrib.messages import get_messages
+from django.db import connection
 from unittest.mock import patch, Mock
+from contextlib import contextmanager
+import functools
+from types import MappingProxyType
 import tempfile
 import shutil
 import os
 from PIL import Image
 import io
 
+from users.models import Profile
+from . import factories
 from .factories import (
     UserFactory, StaffUserFactory, SuperUserFactory,
-    ProfileFactory, create_test_image
+    ProfileFactory, bulk_create_factory, create_test_image
 )
 
 User = get_user_model()
 
+# Password hashing strength is irrelevant in tests; MD5 keeps user creation cheap
+TEST_PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
 
+# A valid 1x1 grayscale JPEG for tests that only need "some image" to upload
+MINIMAL_JPEG = bytes.fromhex(
+    'ffd8ffe000104a46494600010100000100010000ffdb004300ffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffc0000b080001'
+    '000101011100ffc40014000100000000000000000000000000000003ffc40014'
+    '100100000000000000000000000000000000ffda0008010100003f0037ffd9'
+)
+
+# Pre-encoded 1x1 images per format, so fast uploads never allocate or encode pixels
+MINIMAL_IMAGES = {
+    'JPEG': MINIMAL_JPEG,
+    'PNG': bytes.fromhex(
+        '89504e470d0a1a0a0000000d49484452000000010000000108000000003a7e9b55'
+        '0000000a4944415478da6360000000020001e527defc0000000049454e44ae426082'
+    ),
+    'GIF': bytes.fromhex(
+        '474946383761010001008100000000000000000000000000002c000000000100010000080400010404003b'
+    ),
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _encoded_image(size, format_name, fill):
+    """Encode a solid-color RGB test image once per size/format/color"""
+    image = Image.new('RGB', size, color=fill)
+    image_io = io.BytesIO()
+    image.save(image_io, format=format_name)
+    return image_io.getvalue()
+
+
+@functools.lru_cache(maxsize=None)
+def cached_reverse(viewname, **kwargs):
+    """reverse() for URLs with constant arguments, resolved once per test run"""
+    return reverse(viewname, kwargs=kwargs or None)
+
+
+def _login_url():
+    """URL of the login page"""
+    return cached_reverse('users:login')
+
+
+@override_settings(PASSWORD_HASHERS=TEST_PASSWORD_HASHERS)
 class BaseTestCase(TestCase):
     """Base test class with common setup and utility methods"""
     
+    # Factory-built objects skip test images unless a test passes with_image=True
+    factory_images = False
+    
+    @classmethod
+    def setUpClass(cls):
+        if not cls.factory_images:
+            images_patcher = patch.object(factories, 'FAST_FACTORIES_SKIP_IMAGES', True)
+            images_patcher.start()
+            cls.addClassCleanup(images_patcher.stop)
+        super().setUpClass()
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Set up common test data once per test class"""
+        # Every test class builds these, so insert them with one multi-row INSERT
+        # where the backend returns primary keys from bulk_create
+        if connection.features.can_return_rows_from_bulk_insert:
+            cls.user, cls.staff_user, cls.superuser = User.objects.bulk_create([
+                UserFactory.build(), StaffUserFactory.build(), SuperUserFactory.build()
+            ])
+        else:
+            cls.user = UserFactory()
+            cls.staff_user = StaffUserFactory()
+            cls.superuser = SuperUserFactory()
+    
+    _media_root = None
+    
     def setUp(self):
-        """Set up common test data"""
+        """Set up per-test state"""
         self.client = Client()
-        self.user = UserFactory()
-        self.staff_user = StaffUserFactory()
-        self.superuser = SuperUserFactory()
-        
-        # Create test media directory
-        self.media_root = tempfile.mkdtemp()
     
     def tearDown(self):
         """Clean up test data"""
-        # Remove test media directory
-        if hasattr(self, 'media_root') and os.path.exists(self.media_root):
-            shutil.rmtree(self.media_root)
+        # Remove test media directory if the test created one
+        if self._media_root is not None:
+            shutil.rmtree(self._media_root, ignore_errors=True)
+            self._media_root = None
+    
+    @property
+    def media_root(self):
+        """Temporary media directory for this test, created on first access"""
+        if self._media_root is None:
+            self._media_root = tempfile.mkdtemp()
+        return self._media_root
     
     def login_user(self, user=None):
-        """Login a user for testing"""
+        """Login a user for testing, skipping authentication and password hashing"""
         if user is None:
             user = self.user
         
-        login_successful = self.client.login(
-            username=user.username, 
-            password='testpass123'
-        )
+        self.client.force_login(user)
+        return user
+    
+    def login_via_form(self, user=None, password='testpass123'):
+        """Login a user through the authentication backend, as the login form does"""
+        if user is None:
+            user = self.user
+        
+        login_successful = self.client.login(email=user.email, password=password)
         self.assertTrue(login_successful)
         return user
     
@@ -66,16 +151,11 @@ class BaseTestCase(TestCase):
         """Logout current user"""
         self.client.logout()
     
-    def get_test_image_file(self, name='test_image.jpg', size=(100, 100)):
-        """Create a test image file for upload testing"""
-        image = Image.new('RGB', size, color='red')
-        image_io = io.BytesIO()
-        image.save(image_io, format='JPEG')
-        image_io.seek(0)
-        
+    def get_test_image_file(self, name='test_image.jpg', size=(100, 100), fast=True):
+        """Create a test image file for upload testing (pass fast=False to honour size)"""
         return SimpleUploadedFile(
             name=name,
-            content=image_io.getvalue(),
+            content=MINIMAL_JPEG if fast else _encoded_image(tuple(size), 'JPEG', 'red'),
             content_type='image/jpeg'
         )
     
@@ -93,9 +173,9 @@ class BaseTestCase(TestCase):
     def assertRedirectsToLogin(self, response, next_url=None):
         """Assert that response redirects to login page"""
         if next_url:
-            expected_url = f"{reverse('users:login')}?next={next_url}"
+            expected_url = f"{_login_url()}?next={next_url}"
         else:
-            expected_url = reverse('users:login')
+            expected_url = _login_url()
         
         self.assertRedirects(response, expected_url)
     
@@ -109,7 +189,8 @@ class BaseTestCase(TestCase):
             field_errors = form.errors[field_name]
             self.assertIn(error_message, field_errors)
     
-    def create_user_with_profile(self, **kwargs):
+    @classmethod
+    def create_user_with_profile(cls, **kwargs):
         """Create a user with associated profile"""
         user = UserFactory(**kwargs)
         profile = ProfileFactory(user=user)
@@ -177,16 +258,17 @@ class EmailTestMixin:
             self.assertGreater(len(mail.outbox), 0)
         
         if subject or to:
-            matching_emails = []
-            for email in mail.outbox:
-                if subject and subject not in email.subject:
-                    continue
-                if to and to not in email.to:
-                    continue
-                matching_emails.append(email)
+            # Stop at the first match instead of collecting every matching email
+            matching_email = next(
+                (
+                    email for email in mail.outbox
+                    if (not subject or subject in email.subject) and (not to or to in email.to)
+                ),
+                None
+            )
             
-            self.assertGreater(len(matching_emails), 0)
-            return matching_emails[0]
+            self.assertIsNotNone(matching_email, "No matching email was sent")
+            return matching_email
         
         return mail.outbox[-1]
 
@@ -194,21 +276,20 @@ class EmailTestMixin:
 class FileTestMixin:
     """Mixin for testing file upload functionality"""
     
-    @override_settings(MEDIA_ROOT=tempfile.gettempdir())
     def create_uploaded_file(self, name='test_file.txt', content=b'test content'):
         """Create a simple uploaded file for testing"""
         return SimpleUploadedFile(name, content)
     
-    def create_image_file(self, name='test_image.jpg', size=(100, 100), format='JPEG'):
-        """Create an image file for testing"""
-        image = Image.new('RGB', size, color='blue')
-        image_io = io.BytesIO()
-        image.save(image_io, format=format)
-        image_io.seek(0)
+    def create_image_file(self, name='test_image.jpg', size=(100, 100), format='JPEG', fast=True):
+        """Create an image file for testing (fast images are 1x1; pass fast=False to honour size)"""
+        if fast and format in MINIMAL_IMAGES:
+            content = MINIMAL_IMAGES[format]
+        else:
+            content = _encoded_image(tuple(size), format, 'blue')
         
         return SimpleUploadedFile(
             name=name,
-            content=image_io.getvalue(),
+            content=content,
             content_type=f'image/{format.lower()}'
         )
     
@@ -246,35 +327,19 @@ class MockTestMixin:
 class PerformanceTestMixin:
     """Mixin for performance testing"""
     
+    @contextmanager
     def assertQueryCountEqual(self, count):
         """Assert that a specific number of database queries are executed"""
-        from django.test.utils import override_settings
-        from django.db import connection
-        
-        @override_settings(DEBUG=True)
-        def test_with_query_count():
-            initial_queries = len(connection.queries)
-            yield
-            final_queries = len(connection.queries)
-            query_count = final_queries - initial_queries
-            self.assertEqual(query_count, count)
-        
-        return test_with_query_count()
+        with CaptureQueriesContext(connection) as context:
+            yield context
+        self.assertEqual(len(context), count)
     
+    @contextmanager
     def assertMaxQueryCount(self, max_count):
         """Assert that no more than max_count queries are executed"""
-        from django.test.utils import override_settings
-        from django.db import connection
-        
-        @override_settings(DEBUG=True)
-        def test_with_max_query_count():
-            initial_queries = len(connection.queries)
-            yield
-            final_queries = len(connection.queries)
-            query_count = final_queries - initial_queries
-            self.assertLessEqual(query_count, max_count)
-        
-        return test_with_max_query_count()
+        with CaptureQueriesContext(connection) as context:
+            yield context
+        self.assertLessEqual(len(context), max_count)
 
 
 class IntegrationTestCase(BaseTestCase, EmailTestMixin, FileTestMixin):
@@ -282,17 +347,32 @@ class IntegrationTestCase(BaseTestCase, EmailTestMixin, FileTestMixin):
     Base class for integration tests that test multiple components together
     """
     
-    def setUp(self):
-        super().setUp()
+    WORKFLOW_METHODS = frozenset({'GET', 'POST', 'PUT', 'DELETE'})
+    
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
         # Set up integration test specific data
-        self.setup_test_data()
+        cls.setup_test_data()
     
-    def setup_test_data(self):
+    @classmethod
+    def setup_test_data(cls):
         """Set up comprehensive test data for integration tests"""
-        # Create users with profiles
-        self.regular_user, self.regular_profile = self.create_user_with_profile()
-        self.author_user, self.author_profile = self.create_user_with_profile()
+        # Create users with profiles, one multi-row INSERT per table where the
+        # backend returns primary keys from bulk_create
+        if connection.features.can_return_rows_from_bulk_insert:
+            users = bulk_create_factory(UserFactory, 2)
+            profiles = Profile.objects.bulk_create(
+                [ProfileFactory.build(user=user) for user in users]
+            )
+        else:
+            users, profiles = zip(*(cls.create_user_with_profile() for _ in range(2)))
         
+        cls.regular_user, cls.author_user = users
+        cls.regular_profile, cls.author_profile = profiles
+    
+    def setUp(self):
+        super().setUp()
         # Login regular user by default
         self.login_user(self.regular_user)
     
@@ -303,53 +383,52 @@ class IntegrationTestCase(BaseTestCase, EmailTestMixin, FileTestMixin):
         """
         responses = []
         for method, url, data in steps:
-            if method.upper() == 'GET':
-                response = self.client.get(url)
-            elif method.upper() == 'POST':
-                response = self.client.post(url, data)
-            elif method.upper() == 'PUT':
-                response = self.client.put(url, data)
-            elif method.upper() == 'DELETE':
-                response = self.client.delete(url)
-            else:
+            if method.upper() not in self.WORKFLOW_METHODS:
                 raise ValueError(f"Unsupported HTTP method: {method}")
             
+            handler = getattr(self.client, method.lower())
+            response = handler(url) if data is None else handler(url, data)
             responses.append(response)
         
         return responses
 
 
-# Test data fixtures
-TEST_USER_DATA = {
+# Test data fixtures (read-only; copy with dict(...) before modifying)
+TEST_USER_DATA = MappingProxyType({
     'username': 'testuser',
     'email': 'test@example.com',
     'first_name': 'Test',
     'last_name': 'User',
     'password': 'testpass123'
-}
+})
 
-TEST_PROJECT_DATA = {
+TEST_PROJECT_DATA = MappingProxyType({
     'title': 'Test Project',
     'short_description': 'A test project for testing',
     'description': 'This is a comprehensive test project description.',
     'technologies': 'Python, Django, HTML, CSS',
     'status': 'completed',
     'is_published': True
-}
+})
 
-TEST_BLOG_POST_DATA = {
+# technologies parsed the same way as Project.technology_list
+TEST_PROJECT_TECHNOLOGIES = tuple(
+    tech.strip() for tech in TEST_PROJECT_DATA['technologies'].split(',')
+)
+
+TEST_BLOG_POST_DATA = MappingProxyType({
     'title': 'Test Blog Post',
     'excerpt': 'This is a test blog post excerpt.',
     'content': 'This is the full content of the test blog post.',
     'status': 'published'
-}
+})
 
-TEST_CONTACT_DATA = {
+TEST_CONTACT_DATA = MappingProxyType({
     'name': 'Test Contact',
     'email': 'contact@example.com',
     'subject': 'general',
     'message': 'This is a test contact message.'
-}
+})
 
 
 def skip_if_no_db(test_func):
@@ -372,3 +451,15 @@ def override_media_root(test_func):
             with override_settings(MEDIA_ROOT=temp_dir):
                 return test_func(*args, **kwargs)
     return wrapper
+
+
+# Uploads kept in a dict; only for tests that never need a file's filesystem path
+IN_MEMORY_STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.InMemoryStorage'},
+    'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+}
+
+
+def override_in_memory_storage(test_func):
+    """Decorator to store uploaded files in memory instead of under MEDIA_ROOT"""
+    return override_settings(STORAGES=IN_MEMORY_STORAGES)(test_func)
@@ -1,3 +1,330 @@
-from django.test import TestCase
+"""
+Tests for Core app test helpers
+"""
 
-# Create your tests here.
+import os
+from unittest.mock import patch
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.test.utils import override_settings
+from django.urls import reverse
+
+from PIL import Image
+
+from .test_utils import (
+    BaseTestCase, EmailTestMixin, FileTestMixin, PerformanceTestMixin, cached_reverse,
+    override_in_memory_storage, override_media_root,
+    TEST_PROJECT_DATA, TEST_PROJECT_TECHNOLOGIES
+)
+from .factories import (
+    UserFactory, FastUserFactory, CategoryFactory, ProjectFactory,
+    bulk_create_factory, seed_projects
+)
+from .paginator import ApproxCountPaginator, CachedApproxCountPaginator, CachedCountPaginator
+
+User = get_user_model()
+
+
+class BulkCreateFactoryTests(BaseTestCase):
+    """Test cases for bulk_create_factory"""
+
+    def test_bulk_create_users(self):
+        """Test that users are inserted in a single query and can log in"""
+        existing = User.objects.count()
+        
+        with self.assertNumQueries(1):
+            users = bulk_create_factory(UserFactory, 10)
+        
+        self.assertEqual(len(users), 10)
+        self.assertEqual(User.objects.count(), existing + 10)
+        self.assertTrue(users[0].check_password('testpass123'))
+
+    def test_bulk_create_fast_users(self):
+        """Test that FastUserFactory builds valid, unique users"""
+        users = bulk_create_factory(FastUserFactory, 5)
+        
+        self.assertEqual(len({user.email for user in users}), 5)
+        self.assertEqual(users[0].bio, '')
+        self.assertTrue(users[0].check_password('testpass123'))
+
+    def test_bulk_create_with_related_objects(self):
+        """Test bulk creating objects that reference saved related objects"""
+        category = CategoryFactory()
+        
+        projects = bulk_create_factory(
+            ProjectFactory, 5, user=self.user, category=category
+        )
+        
+        self.assertEqual(len(projects), 5)
+        self.assertEqual(self.user.projects.count(), 5)
+
+
+class SeedProjectsTests(BaseTestCase):
+    """Test cases for seed_projects"""
+
+    def test_projects_share_user_and_category_pool(self):
+        """Test that seeded projects reuse the pre-created users and categories"""
+        users_before = User.objects.count()
+        
+        users, categories, projects = seed_projects(
+            project_count=12, user_count=3, category_count=2
+        )
+        
+        self.assertEqual(User.objects.count(), users_before + 3)
+        self.assertEqual(len(projects), 12)
+        self.assertEqual({p.user for p in projects}, set(users))
+        self.assertEqual({p.category for p in projects}, set(categories))
+
+
+class UserFactoryPasswordTests(BaseTestCase):
+    """Test cases for UserFactory password handling"""
+
+    def test_default_password_single_insert(self):
+        """Test that creating a user with the default password is one query"""
+        with self.assertNumQueries(1):
+            user = UserFactory()
+        
+        self.assertTrue(user.check_password('testpass123'))
+
+    def test_custom_password(self):
+        """Test passing a custom password through set_password"""
+        user = UserFactory(set_password='otherpass456')
+        user.refresh_from_db()
+        
+        self.assertTrue(user.check_password('otherpass456'))
+
+    def test_users_hashed_with_md5_and_can_log_in(self):
+        """Test that base-class users use the fast hasher and still log in"""
+        self.assertTrue(self.user.password.startswith('md5$'))
+        self.assertTrue(self.client.login(email=self.user.email, password='testpass123'))
+
+    def test_base_users_saved_with_roles(self):
+        """Test that the batch-inserted base-class users are stored with their roles"""
+        roles = User.objects.filter(
+            pk__in=[self.user.pk, self.staff_user.pk, self.superuser.pk]
+        ).order_by('pk').values_list('is_staff', 'is_superuser')
+        
+        self.assertEqual(list(roles), [(False, False), (True, False), (True, True)])
+        self.assertTrue(self.client.login(email=self.superuser.email, password='testpass123'))
+
+
+class ImageFactoryTests(BaseTestCase):
+    """Test cases for factories that attach test images"""
+
+    @override_media_root
+    def test_project_image_attached_on_insert(self):
+        """Test that the featured image is saved with the initial INSERT"""
+        user = UserFactory()
+        category = CategoryFactory()
+        
+        with self.assertNumQueries(1):
+            project = ProjectFactory(user=user, category=category, with_image=True)
+        
+        self.assertTrue(project.featured_image.name.startswith('projects/featured/'))
+
+    def test_images_skipped_by_default_in_base_test_case(self):
+        """Test that factories leave image fields blank unless asked for one"""
+        project = ProjectFactory()
+        
+        self.assertFalse(project.featured_image)
+
+
+@override_settings(CACHES={
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}
+})
+class CachedCountPaginatorTests(BaseTestCase):
+    """Test cases for CachedCountPaginator"""
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    def test_count_is_cached_per_query(self):
+        """Test that the count query runs once per distinct queryset"""
+        queryset = User.objects.filter(is_active=True).order_by('pk')
+        expected = queryset.count()
+        
+        with self.assertNumQueries(1):
+            self.assertEqual(CachedCountPaginator(queryset, 2).count, expected)
+        with self.assertNumQueries(0):
+            self.assertEqual(CachedCountPaginator(queryset, 2).count, expected)
+        
+        staff_only = queryset.filter(is_staff=True)
+        with self.assertNumQueries(1):
+            staff_count = CachedCountPaginator(staff_only, 2).count
+        self.assertEqual(staff_count, staff_only.count())
+
+    def test_count_for_plain_lists(self):
+        """Test that non-queryset object lists fall back to len()"""
+        self.assertEqual(CachedCountPaginator([1, 2, 3], 2).count, 3)
+
+    def test_approx_count_cached(self):
+        """Test that CachedApproxCountPaginator caches the estimated count"""
+        queryset = User.objects.order_by('pk')
+        
+        with patch.object(ApproxCountPaginator, 'count', property(lambda self: 5000)):
+            self.assertEqual(CachedApproxCountPaginator(queryset, 2).count, 5000)
+        with self.assertNumQueries(0):
+            self.assertEqual(CachedApproxCountPaginator(queryset, 2).count, 5000)
+
+
+class ApproxCountPaginatorTests(BaseTestCase):
+    """Test cases for ApproxCountPaginator"""
+
+    def test_exact_count_without_planner_estimates(self):
+        """Test that backends other than PostgreSQL get the exact count"""
+        queryset = User.objects.order_by('pk')
+        expected = queryset.count()
+        
+        with self.assertNumQueries(1):
+            self.assertEqual(ApproxCountPaginator(queryset, 2).count, expected)
+
+    def test_count_for_plain_lists(self):
+        """Test that non-queryset object lists fall back to len()"""
+        self.assertEqual(ApproxCountPaginator([1, 2, 3], 2).count, 3)
+
+
+class TestImageFileTests(FileTestMixin, BaseTestCase):
+    """Test cases for the upload image helpers"""
+
+    def test_image_bytes_reused_with_fresh_files(self):
+        """Test that repeated calls share encoded bytes but not file objects"""
+        first = self.get_test_image_file()
+        second = self.get_test_image_file()
+        
+        self.assertIsNot(first, second)
+        self.assertEqual(first.read(), second.read())
+
+    def test_image_color_and_format_respected(self):
+        """Test that the two helpers produce distinct, correctly typed images"""
+        image_file = self.create_image_file(name='test.png', format='PNG')
+        
+        self.assertEqual(image_file.content_type, 'image/png')
+        self.assertNotEqual(image_file.read(), self.get_test_image_file().read())
+
+    def test_fast_image_is_valid_jpeg(self):
+        """Test that the precomputed image opens as a JPEG"""
+        image = Image.open(self.get_test_image_file())
+        
+        self.assertEqual(image.format, 'JPEG')
+        self.assertEqual(image.size, (1, 1))
+
+    def test_fast_images_for_each_format(self):
+        """Test that fast images are valid 1x1 files in the requested format"""
+        for format_name in ('JPEG', 'PNG', 'GIF'):
+            with self.subTest(format=format_name):
+                image = Image.open(self.create_image_file(format=format_name))
+                
+                self.assertEqual(image.format, format_name)
+                self.assertEqual(image.size, (1, 1))
+
+    def test_slow_image_honours_size(self):
+        """Test that fast=False encodes an image of the requested size"""
+        image = Image.open(self.create_image_file(size=(40, 20), fast=False))
+        
+        self.assertEqual(image.size, (40, 20))
+
+
+class MediaRootTests(BaseTestCase):
+    """Test cases for the lazily created test media directory"""
+
+    def test_media_root_created_on_access_and_removed(self):
+        """Test that the directory exists only once requested and is cleaned up"""
+        self.assertIsNone(self._media_root)
+        
+        media_root = self.media_root
+        self.assertTrue(os.path.isdir(media_root))
+        self.assertEqual(self.media_root, media_root)
+        
+        self.tearDown()
+        self.assertFalse(os.path.exists(media_root))
+
+    @override_in_memory_storage
+    def test_in_memory_storage_keeps_uploads_off_disk(self):
+        """Test that uploads under override_in_memory_storage are not written to MEDIA_ROOT"""
+        name = default_storage.save('uploads/test.txt', ContentFile(b'test content'))
+        
+        self.assertTrue(default_storage.exists(name))
+        self.assertFalse(os.path.exists(os.path.join(settings.MEDIA_ROOT, name)))
+
+
+class PerformanceTestMixinTests(PerformanceTestMixin, BaseTestCase):
+    """Test cases for the query-count assertions"""
+
+    def test_query_count_equal(self):
+        """Test that the exact query count is enforced"""
+        with self.assertQueryCountEqual(1):
+            list(User.objects.all())
+        
+        with self.assertRaises(AssertionError):
+            with self.assertQueryCountEqual(0):
+                list(User.objects.all())
+
+    def test_max_query_count(self):
+        """Test that exceeding the maximum query count fails"""
+        with self.assertMaxQueryCount(2):
+            list(User.objects.all())
+        
+        with self.assertRaises(AssertionError):
+            with self.assertMaxQueryCount(1):
+                list(User.objects.all())
+                list(User.objects.all())
+
+
+class EmailTestMixinTests(EmailTestMixin, BaseTestCase):
+    """Test cases for assertEmailSent"""
+
+    def test_filters_by_recipient_and_subject(self):
+        """Test that the first email matching both filters is returned"""
+        mail.send_mail('Welcome', 'Hi', 'noreply@example.com', ['a@example.com'])
+        mail.send_mail('Password reset', 'Reset', 'noreply@example.com', ['a@example.com'])
+        mail.send_mail('Password reset', 'Reset', 'noreply@example.com', ['b@example.com'])
+        
+        email = self.assertEmailSent(subject='reset', to='b@example.com')
+        self.assertEqual(email.to, ['b@example.com'])
+        
+        with self.assertRaises(AssertionError):
+            self.assertEmailSent(subject='Welcome', to='b@example.com')
+
+    def test_index_refreshed_after_new_email(self):
+        """Test that emails sent after an assertion are still found"""
+        mail.send_mail('First', 'Body', 'noreply@example.com', ['a@example.com'])
+        self.assertEmailSent(to='a@example.com')
+        
+        mail.send_mail('Second', 'Body', 'noreply@example.com', ['c@example.com'])
+        self.assertEqual(self.assertEmailSent(to='c@example.com').subject, 'Second')
+
+
+class TestDataFixtureTests(BaseTestCase):
+    """Test cases for the shared test data dicts"""
+
+    def test_fixtures_are_read_only(self):
+        """Test that module-level fixtures cannot be mutated in place"""
+        with self.assertRaises(TypeError):
+            TEST_PROJECT_DATA['title'] = 'Changed'
+        
+        data = dict(TEST_PROJECT_DATA, title='Changed')
+        self.assertEqual(data['title'], 'Changed')
+
+    def test_project_technologies_match_model_parsing(self):
+        """Test that the precomputed technologies match Project.technology_list"""
+        project = ProjectFactory(technologies=TEST_PROJECT_DATA['technologies'])
+        
+        self.assertEqual(list(TEST_PROJECT_TECHNOLOGIES), project.technology_list)
+
+
+class CachedReverseTests(BaseTestCase):
+    """Test cases for cached_reverse"""
+
+    def test_matches_reverse(self):
+        """Test that cached URLs match reverse() with and without kwargs"""
+        self.assertEqual(cached_reverse('users:login'), reverse('users:login'))
+        self.assertEqual(
+            cached_reverse('portfolio:project_detail', slug='demo'),
+            reverse('portfolio:project_detail', kwargs={'slug': 'demo'})
+        )
@@ -6,6 +6,9 @@ import sys
 
 def main():
     """Run administrative tasks."""
+    if len(sys.argv) > 1 and sys.argv[1] == 'test':
+        # In-memory database with migrations disabled, see test_settings
+        os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'portfolio_platform.test_settings')
     os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'portfolio_platform.settings')
     try:
         from django.core.management import execute_from_command_line
@@ -1,4 +1,5 @@
 from django.contrib import admin
+from django.db.models import Count
 from django.utils.html import format_html
 from .models import (
     Category, Project, ProjectImage, Skill, Experience, 
@@ -19,9 +20,13 @@ class CategoryAdmin(admin.ModelAdmin):
     search_fields = ['name', 'description']
     prepopulated_fields = {'slug': ('name',)}
     
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(_project_count=Count('project'))
+    
     def project_count(self, obj):
-        return obj.project_set.count()
+        return obj._project_count
     project_count.short_description = 'Projects'
+    project_count.admin_order_field = '_project_count'
     
     def color_display(self, obj):
         return format_html(
@@ -38,12 +43,13 @@ class ProjectAdmin(admin.ModelAdmin):
         'title', 'user', 'category', 'status', 'is_featured', 'is_published',
         'views', 'like_count', 'created_at'
     ]
+    list_select_related = ['user', 'category']
     list_filter = [
         'status', 'is_featured', 'is_published', 'category', 'created_at', 'user'
     ]
     search_fields = ['title', 'description', 'technologies']
     prepopulated_fields = {'slug': ('title',)}
-    filter_horizontal = ['likes']
+    raw_id_fields = ['user', 'category', 'likes']
     inlines = [ProjectImageInline]
     
     fieldsets = (
@@ -63,21 +69,18 @@ class ProjectAdmin(admin.ModelAdmin):
             'fields': ('is_featured', 'is_published', 'tags')
         }),
         ('Statistics', {
-            'fields': ('views', 'likes'),
+            'fields': ('views', 'like_count', 'likes'),
             'classes': ('collapse',)
         }),
     )
     
-    readonly_fields = ['views']
-    
-    def like_count(self, obj):
-        return obj.like_count
-    like_count.short_description = 'Likes'
+    readonly_fields = ['views', 'like_count']
 
 
 @admin.register(Skill)
 class SkillAdmin(admin.ModelAdmin):
     list_display = ['name', 'user', 'category', 'proficiency', 'percentage', 'created_at']
+    list_select_related = ['user']
     list_filter = ['proficiency', 'category', 'user', 'created_at']
     search_fields = ['name', 'category']
     list_editable = ['percentage']
@@ -88,6 +91,7 @@ class ExperienceAdmin(admin.ModelAdmin):
     list_display = [
         'position', 'company', 'user', 'start_date', 'end_date', 'is_current'
     ]
+    list_select_related = ['user']
     list_filter = ['is_current', 'start_date', 'user']
     search_fields = ['position', 'company', 'description']
     date_hierarchy = 'start_date'
@@ -98,6 +102,7 @@ class EducationAdmin(admin.ModelAdmin):
     list_display = [
         'degree', 'field_of_study', 'institution', 'user', 'start_date', 'end_date'
     ]
+    list_select_related = ['user']
     list_filter = ['degree', 'is_current', 'start_date', 'user']
     search_fields = ['institution', 'field_of_study', 'description']
     date_hierarchy = 'start_date'
@@ -106,6 +111,7 @@ class EducationAdmin(admin.ModelAdmin):
 @admin.register(Achievement)
 class AchievementAdmin(admin.ModelAdmin):
     list_display = ['title', 'issuer', 'user', 'date_received']
+    list_select_related = ['user']
     list_filter = ['date_received', 'issuer', 'user']
     search_fields = ['title', 'issuer', 'description']
     date_hierarchy = 'date_received'
@@ -116,6 +122,7 @@ class TestimonialAdmin(admin.ModelAdmin):
     list_display = [
         'client_name', 'client_company', 'user', 'rating', 'is_featured', 'created_at'
     ]
+    list_select_related = ['user']
     list_filter = ['rating', 'is_featured', 'created_at', 'user']
     search_fields = ['client_name', 'client_company', 'testimonial']
     list_editable = ['is_featured', 'rating']
@@ -0,0 +1,15 @@
+"""
+Cache keys shared by the portfolio views and the signal handlers that invalidate them
+"""
+
+# Homepage and about page listings are the same for every visitor; the cached
+# context is dropped when projects, categories or testimonials change
+HOME_CONTEXT_CACHE_KEY = 'portfolio_home_context'
+HOME_CONTEXT_CACHE_TIMEOUT = 60
+ABOUT_CONTEXT_CACHE_KEY = 'portfolio_about_context'
+ABOUT_CONTEXT_CACHE_TIMEOUT = 60
+# Ordered project ids of one list page, and the list's count, per combination of
+# filters; project changes drop the version key, which moves both to fresh cache keys
+PROJECT_LIST_CACHE_PREFIX = 'portfolio_project_list'
+PROJECT_LIST_CACHE_TIMEOUT = 60
+PROJECT_LIST_CACHE_VERSION_KEY = 'portfolio_project_list_version'
@@ -0,0 +1,60 @@
+# Generated by Django 5.2.5 on 2026-10-14 14:41
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+SEARCH_VECTOR_SQL = """
+CREATE FUNCTION portfolio_project_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('pg_catalog.english', coalesce(NEW.title, '')), 'A') ||
+        setweight(to_tsvector('pg_catalog.english',
+            coalesce(NEW.short_description, '') || ' ' || coalesce(NEW.description, '')), 'B') ||
+        setweight(to_tsvector('pg_catalog.english', coalesce(NEW.technologies, '')), 'C');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER portfolio_project_search_vector_update
+    BEFORE INSERT OR UPDATE OF title, short_description, description, technologies
+    ON portfolio_project
+    FOR EACH ROW EXECUTE FUNCTION portfolio_project_search_vector_update();
+
+UPDATE portfolio_project SET title = title;
+
+CREATE INDEX portfolio_project_search_gin ON portfolio_project USING gin (search_vector);
+"""
+
+REVERSE_SEARCH_VECTOR_SQL = """
+DROP INDEX IF EXISTS portfolio_project_search_gin;
+DROP TRIGGER IF EXISTS portfolio_project_search_vector_update ON portfolio_project;
+DROP FUNCTION IF EXISTS portfolio_project_search_vector_update();
+"""
+
+
+def create_search_trigger(apps, schema_editor):
+    # Trigger and GIN index are PostgreSQL-only; other backends fall back to icontains
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(SEARCH_VECTOR_SQL)
+
+
+def drop_search_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(REVERSE_SEARCH_VECTOR_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0003_admin_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(create_search_trigger, drop_search_trigger),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 5.2.5 on 2026-10-14 14:48
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0004_project_search_vector'),
+        ('taggit', '0006_rename_taggeditem_content_type_object_id_taggit_tagg_content_8fc721_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # Superseded by the composites below, which share their leading columns
+        migrations.RemoveIndex(
+            model_name='project',
+            name='portfolio_p_is_feat_a2828e_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='project',
+            name='portfolio_p_user_id_2d93af_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='project',
+            name='portfolio_p_categor_3cd246_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='project',
+            name='portfolio_p_status_ef0bfd_idx',
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['is_featured', 'is_published', '-created_at'], name='portfolio_p_is_feat_d1dde9_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['category', 'is_published', '-created_at'], name='portfolio_p_categor_aa2d3e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['user', 'is_published', '-created_at'], name='portfolio_p_user_id_7a727e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['status', 'is_published', '-created_at'], name='portfolio_p_status_5049d3_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['-views'], name='portfolio_p_views_045aaa_idx'),
+        ),
+    ]
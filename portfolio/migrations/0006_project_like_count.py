@@ -0,0 +1,28 @@
+# Generated by Django 5.2.5 on 2026-10-14 14:51
+
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def backfill_like_counts(apps, schema_editor):
+    Project = apps.get_model('portfolio', 'Project')
+    like_totals = Project.likes.through.objects.filter(
+        project_id=models.OuterRef('pk')
+    ).order_by().values('project_id').annotate(total=models.Count('*')).values('total')
+    Project.objects.update(like_count=Coalesce(models.Subquery(like_totals), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0005_project_listing_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='like_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_like_counts, migrations.RunPython.noop),
+    ]
@@ -1,4 +1,7 @@
-from django.db import models
+from django.core.cache import cache
+from django.db import IntegrityError, models, transaction
+from django.contrib.postgres.search import SearchVectorField
+from django.db.models.functions import Coalesce
 from django.urls import reverse
 from django.contrib.auth import get_user_model
 from PIL import Image
@@ -16,6 +19,9 @@ class Category(models.Model):
     color = models.CharField(max_length=7, default='#007bff', help_text="Hex color code")
     created_at = models.DateTimeField(auto_now_add=True)
     
+    ALL_CACHE_KEY = 'portfolio_categories_all'
+    ALL_CACHE_TIMEOUT = 300
+    
     class Meta:
         verbose_name_plural = 'Categories'
         ordering = ['name']
@@ -25,6 +31,15 @@ class Category(models.Model):
     
     def get_absolute_url(self):
         return reverse('portfolio:category_detail', kwargs={'slug': self.slug})
+    
+    @classmethod
+    def get_all(cls):
+        """All categories for filter dropdowns, cached until a category changes"""
+        return cache.get_or_set(
+            cls.ALL_CACHE_KEY,
+            lambda: list(cls.objects.all()),
+            cls.ALL_CACHE_TIMEOUT,
+        )
 
 
 class Skill(models.Model):
@@ -91,6 +106,8 @@ class Project(models.Model):
     is_published = models.BooleanField(default=True)
     views = models.PositiveIntegerField(default=0)
     likes = models.ManyToManyField(User, related_name='liked_projects', blank=True)
+    # Denormalized likes.count(), kept in sync by portfolio.signals
+    like_count = models.PositiveIntegerField(default=0, editable=False)
     
     # Tags
     tags = TaggableManager(blank=True)
@@ -99,12 +116,29 @@ class Project(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    # Weighted full-text search (kept up to date by a database trigger on PostgreSQL)
+    search_vector = SearchVectorField(null=True, editable=False)
+    
+    FEATURED_IMAGE_MAX_SIZE = (1200, 800)
+    FEATURED_IMAGE_QUALITY = 85
+    # Pillow's optimize pass is slow on large images; enable only if file size matters more
+    FEATURED_IMAGE_OPTIMIZE = False
+    
+    # Name of the featured image as loaded from the database (None for new instances)
+    _loaded_featured_image = None
+    
     class Meta:
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['-created_at']),
-            models.Index(fields=['is_featured', '-created_at']),
             models.Index(fields=['is_published', '-created_at']),
+            # Listings and admin filters by flag, category, owner or status; the
+            # leading column alone also serves filters that ignore is_published
+            models.Index(fields=['is_featured', 'is_published', '-created_at']),
+            models.Index(fields=['category', 'is_published', '-created_at']),
+            models.Index(fields=['user', 'is_published', '-created_at']),
+            models.Index(fields=['status', 'is_published', '-created_at']),
+            models.Index(fields=['-views']),
         ]
     
     def __str__(self):
@@ -115,24 +149,90 @@ class Project(models.Model):
     
     @property
     def technology_list(self):
-        if self.technologies:
-            return [tech.strip() for tech in self.technologies.split(',')]
-        return []
+        # Parsed once per technologies value, so repeated template access is free
+        # while edits to technologies are still picked up
+        cached = self.__dict__.get('_technology_list')
+        if cached is None or cached[0] != self.technologies:
+            if self.technologies:
+                parsed = [tech.strip() for tech in self.technologies.split(',')]
+            else:
+                parsed = []
+            cached = self.__dict__['_technology_list'] = (self.technologies, parsed)
+        return cached[1]
+    
+    @classmethod
+    def refresh_like_counts(cls, project_ids):
+        """Recount likes for the given projects in a single UPDATE"""
+        like_totals = cls.likes.through.objects.filter(
+            project_id=models.OuterRef('pk')
+        ).order_by().values('project_id').annotate(total=models.Count('*')).values('total')
+        cls.objects.filter(pk__in=project_ids).update(
+            like_count=Coalesce(models.Subquery(like_totals), 0)
+        )
+    
+    @classmethod
+    def toggle_like(cls, project_id, user_id):
+        """Like or unlike a project for a user; returns (liked, like_count), or raises DoesNotExist"""
+        Like = cls.likes.through
+        with transaction.atomic():
+            deleted, _ = Like.objects.filter(project_id=project_id, user_id=user_id).delete()
+            liked = not deleted
+            delta = -deleted
+            if liked:
+                try:
+                    with transaction.atomic():
+                        Like.objects.create(project_id=project_id, user_id=user_id)
+                    delta = 1
+                except IntegrityError:
+                    # A concurrent click inserted the like first; it is already counted
+                    delta = 0
+            # The through table is written directly, so m2m_changed doesn't adjust the count
+            if not cls.objects.filter(pk=project_id).update(like_count=models.F('like_count') + delta):
+                raise cls.DoesNotExist('No project matches the given query.')
+            like_count = cls.objects.values_list('like_count', flat=True).get(pk=project_id)
+        return liked, like_count
+    
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        if 'featured_image' in field_names:
+            instance._loaded_featured_image = values[field_names.index('featured_image')]
+        return instance
     
     @property
-    def like_count(self):
-        return self.likes.count()
+    def featured_image_changed(self):
+        """Whether featured_image differs from the file last loaded or saved"""
+        if not self.featured_image:
+            return False
+        return (
+            not self.featured_image._committed
+            or self.featured_image.name != self._loaded_featured_image
+        )
     
     def save(self, *args, **kwargs):
+        image_changed = self.featured_image_changed
         super().save(*args, **kwargs)
         
-        # Resize featured image
-        if self.featured_image:
-            img = Image.open(self.featured_image.path)
-            if img.height > 800 or img.width > 1200:
-                output_size = (1200, 800)
-                img.thumbnail(output_size, Image.Resampling.LANCZOS)
-                img.save(self.featured_image.path, optimize=True, quality=85)
+        # Resize a newly assigned featured image in the background once the row is committed
+        if image_changed:
+            from .tasks import queue_featured_image_resize
+            project_id = self.pk
+            transaction.on_commit(lambda: queue_featured_image_resize(project_id))
+        self._loaded_featured_image = self.featured_image.name
+    
+    def resize_featured_image(self):
+        """Shrink the featured image in place to fit FEATURED_IMAGE_MAX_SIZE"""
+        max_width, max_height = self.FEATURED_IMAGE_MAX_SIZE
+        img = Image.open(self.featured_image.path)
+        if img.height > max_height or img.width > max_width:
+            # Let libjpeg downscale while decoding (no-op for non-JPEG files)
+            img.draft('RGB', self.FEATURED_IMAGE_MAX_SIZE)
+            img.thumbnail(self.FEATURED_IMAGE_MAX_SIZE, Image.Resampling.LANCZOS)
+            img.save(
+                self.featured_image.path,
+                optimize=self.FEATURED_IMAGE_OPTIMIZE,
+                quality=self.FEATURED_IMAGE_QUALITY,
+            )
 
 
 class ProjectImage(models.Model):
@@ -167,12 +267,24 @@ class Experience(models.Model):
     
     class Meta:
         ordering = ['-start_date']
+        indexes = [
+            models.Index(fields=['user', '-start_date']),
+        ]
     
     def __str__(self):
         return f"{self.position} at {self.company}"
     
     @property
     def duration(self):
+        # Formatted once per (start_date, end_date) pair; timezone.now() is only
+        # consulted the first time for current roles
+        key = (self.start_date, self.end_date)
+        cached = self.__dict__.get('_duration')
+        if cached is None or cached[0] != key:
+            cached = self.__dict__['_duration'] = (key, self._format_duration())
+        return cached[1]
+    
+    def _format_duration(self):
         from django.utils import timezone
         end = self.end_date or timezone.now().date()
         duration = end - self.start_date
@@ -211,6 +323,9 @@ class Education(models.Model):
     
     class Meta:
         ordering = ['-start_date']
+        indexes = [
+            models.Index(fields=['user', '-start_date']),
+        ]
         verbose_name_plural = 'Education'
     
     def __str__(self):
@@ -0,0 +1,66 @@
+"""
+Signal handlers for the portfolio app
+"""
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models.signals import m2m_changed, post_save, post_delete, pre_delete
+from django.dispatch import receiver
+from .models import Category, Project, Testimonial
+from .cache_keys import HOME_CONTEXT_CACHE_KEY, ABOUT_CONTEXT_CACHE_KEY, PROJECT_LIST_CACHE_VERSION_KEY
+
+User = get_user_model()
+
+
+@receiver([post_save, post_delete], sender=Project)
+@receiver([post_save, post_delete], sender=Category)
+@receiver([post_save, post_delete], sender=Testimonial)
+def invalidate_page_context_cache(sender, **kwargs):
+    """Drop the cached homepage and about page listings when their data changes"""
+    cache.delete_many([HOME_CONTEXT_CACHE_KEY, ABOUT_CONTEXT_CACHE_KEY])
+
+
+@receiver([post_save, post_delete], sender=Project)
+def invalidate_project_list_cache(sender, **kwargs):
+    """Move the project list pages to fresh cache keys when a project changes"""
+    cache.delete(PROJECT_LIST_CACHE_VERSION_KEY)
+
+
+@receiver([post_save, post_delete], sender=Category)
+def invalidate_category_cache(sender, **kwargs):
+    """Drop the cached category list when a category changes"""
+    cache.delete(Category.ALL_CACHE_KEY)
+
+
+@receiver(m2m_changed, sender=Project.likes.through)
+def update_project_like_count(sender, instance, action, reverse, pk_set, **kwargs):
+    """Keep Project.like_count in step with likes added or removed from either side"""
+    if action == 'pre_clear' and reverse:
+        # The cleared projects are not passed to post_clear, so remember them now
+        instance._cleared_project_ids = list(
+            instance.liked_projects.values_list('pk', flat=True)
+        )
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    
+    if not reverse:
+        Project.refresh_like_counts([instance.pk])
+        instance.refresh_from_db(fields=['like_count'])
+    elif action == 'post_clear':
+        Project.refresh_like_counts(instance.__dict__.pop('_cleared_project_ids', []))
+    else:
+        Project.refresh_like_counts(pk_set)
+
+
+@receiver(pre_delete, sender=User)
+def remember_liked_projects(sender, instance, **kwargs):
+    """Record which projects lose a like when this user's rows cascade away"""
+    instance._liked_project_ids = list(instance.liked_projects.values_list('pk', flat=True))
+
+
+@receiver(post_delete, sender=User)
+def refresh_liked_project_counts(sender, instance, **kwargs):
+    """Recount likes on projects whose like rows were deleted with the user"""
+    project_ids = instance.__dict__.pop('_liked_project_ids', [])
+    if project_ids:
+        Project.refresh_like_counts(project_ids)
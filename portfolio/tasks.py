@@ -0,0 +1,32 @@
+"""
+Background tasks for the portfolio app
+"""
+
+import logging
+
+from celery import shared_task
+from .models import Project
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def resize_project_featured_image_task(project_id):
+    """Shrink a project's featured image after it has been uploaded"""
+    project = Project.objects.only('id', 'featured_image').filter(pk=project_id).first()
+    if project is None or not project.featured_image:
+        return
+    
+    project.resize_featured_image()
+
+
+def queue_featured_image_resize(project_id):
+    """Queue the featured image resize, resizing in-process if the broker is unavailable"""
+    try:
+        resize_project_featured_image_task.delay(project_id)
+    except Exception:
+        logger.exception("Failed to queue featured image resize for project %s", project_id)
+        try:
+            resize_project_featured_image_task(project_id)
+        except Exception:
+            logger.exception("Failed to resize featured image for project %s", project_id)
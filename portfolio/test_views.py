@@ -0,0 +1,306 @@
+"""
+Tests for Portfolio app views
+"""
+
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.test.utils import override_settings
+
+from core.test_utils import BaseTestCase, PerformanceTestMixin, cached_reverse
+from core.factories import (
+    ProjectFactory, CategoryFactory, SkillFactory, AchievementFactory, TestimonialFactory
+)
+
+from portfolio.models import Project
+from portfolio.views import ProjectDetailView, ProjectListView, user_portfolio
+
+LOCMEM_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+
+class HomeViewTests(BaseTestCase, PerformanceTestMixin):
+    """Test cases for home view"""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        category = CategoryFactory()
+        cls.projects = [
+            ProjectFactory(
+                slug=f'home-project-{index}', category=category,
+                is_featured=True, is_published=True
+            )
+            for index in range(4)
+        ]
+
+    def test_home_view_get(self):
+        """Test home view renders featured and recent projects"""
+        response = self.client.get(cached_reverse('portfolio:home'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context['featured_projects']), 4)
+        self.assertEqual(len(response.context['recent_projects']), 4)
+
+    def test_home_featured_users_have_published_projects(self):
+        """Test featured users are listed once and only with published projects"""
+        ProjectFactory(slug='draft-project', is_published=False)
+
+        response = self.client.get(cached_reverse('portfolio:home'))
+
+        self.assertCountEqual(
+            response.context['featured_users'],
+            [project.user for project in self.projects]
+        )
+
+    def test_home_view_query_count_is_bounded(self):
+        """Test home view query count does not grow with the number of projects"""
+        with self.assertMaxQueryCount(15):
+            self.client.get(cached_reverse('portfolio:home'))
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class HomeViewCacheTests(BaseTestCase):
+    """Test cases for the cached homepage listings"""
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    def test_home_listings_are_cached(self):
+        """Test that a repeat homepage visit does not query the database"""
+        ProjectFactory(slug='cached-project', is_featured=True)
+        self.client.get(cached_reverse('portfolio:home'))
+
+        with self.assertNumQueries(0):
+            response = self.client.get(cached_reverse('portfolio:home'))
+        self.assertEqual(len(response.context['featured_projects']), 1)
+
+    def test_project_save_invalidates_home_listings(self):
+        """Test that publishing a project refreshes the cached homepage listings"""
+        self.client.get(cached_reverse('portfolio:home'))
+
+        ProjectFactory(slug='new-project', is_featured=True)
+
+        response = self.client.get(cached_reverse('portfolio:home'))
+        self.assertEqual(len(response.context['featured_projects']), 1)
+
+
+class ProjectListViewTests(BaseTestCase, PerformanceTestMixin):
+    """Test cases for Project list view"""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        ProjectFactory.create_batch(3, is_published=True)
+        ProjectFactory(is_published=False)
+
+    def get_queryset(self, **params):
+        view = ProjectListView()
+        view.setup(RequestFactory().get('/projects/', params))
+        return view.get_queryset()
+
+    def test_queryset_excludes_unpublished_projects(self):
+        """Test only published projects are listed"""
+        self.assertEqual(self.get_queryset().count(), 3)
+
+    def test_queryset_prefetches_related_data(self):
+        """Test rendering related data of listed projects issues no extra queries"""
+        projects = list(self.get_queryset())
+
+        with self.assertNumQueries(0):
+            for project in projects:
+                project.category.name
+                project.user.full_name
+                project.slug
+                list(project.tags.all())
+                project.like_count
+
+    def test_queryset_search_matches_text_and_tags(self):
+        """Test search matches project text and tag names once per project"""
+        project = ProjectFactory(title='Realtime dashboard', is_published=True)
+        project.tags.add('websockets', 'websocket-server')
+
+        for query in ('dashboard', 'websocket'):
+            with self.subTest(query=query):
+                self.assertEqual(list(self.get_queryset(q=query)), [project])
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class ProjectListCacheTests(BaseTestCase):
+    """Test cases for the cached project list ids and count"""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.projects = ProjectFactory.create_batch(3, is_published=True)
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    def paginate(self, **params):
+        view = ProjectListView()
+        view.setup(RequestFactory().get('/projects/', params))
+        view.kwargs = {}
+        return view.paginate_queryset(view.get_queryset(), 2)
+
+    def test_page_hydrated_in_cached_order(self):
+        """Test a page holds full projects in list order and reuses the cached ids and count"""
+        paginator, _, object_list, is_paginated = self.paginate(sort='title')
+        expected = sorted(self.projects, key=lambda project: project.title)
+
+        self.assertTrue(is_paginated)
+        self.assertEqual(paginator.count, 3)
+        self.assertEqual(object_list, expected[:2])
+
+        # First visit to page 2: the count is cached from page 1 and the loaded page is reused
+        with self.assertNumQueries(2):
+            self.paginate(sort='title', page=2)
+        
+        # Repeat visit: the count and page ids come from the cache, leaving one
+        # query to load the page and one to prefetch its tags
+        with self.assertNumQueries(2):
+            _, _, object_list, _ = self.paginate(sort='title', page=2)
+        self.assertEqual(object_list, expected[2:])
+
+    def test_filters_get_separate_cache_entries(self):
+        """Test that different filters are not served each other's ids"""
+        self.paginate()
+        _, _, object_list, _ = self.paginate(q='no-such-project')
+
+        self.assertEqual(object_list, [])
+
+    def test_project_changes_invalidate_cached_pages(self):
+        """Test that creating or unpublishing a project refreshes the cached pages"""
+        self.paginate(sort='title')
+        
+        new_project = ProjectFactory(title='AAA first project', is_published=True)
+        paginator, _, object_list, _ = self.paginate(sort='title')
+        self.assertEqual(paginator.count, 4)
+        self.assertEqual(object_list[0], new_project)
+        
+        new_project.is_published = False
+        new_project.save()
+        paginator, _, object_list, _ = self.paginate(sort='title')
+        self.assertEqual(paginator.count, 3)
+        self.assertEqual(len(object_list), 2)
+        self.assertNotIn(new_project, object_list)
+
+
+class ProjectDetailViewTests(BaseTestCase):
+    """Test cases for Project detail view"""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.project = ProjectFactory(slug='detail-project', views=5)
+
+    def get_context(self):
+        view = ProjectDetailView.as_view()
+        request = RequestFactory().get('/projects/detail-project/')
+        request.user = self.user
+        with patch.object(
+            ProjectDetailView, 'render_to_response', side_effect=lambda context: HttpResponse()
+        ) as render_to_response:
+            view(request, slug='detail-project')
+        return render_to_response.call_args.args[0]
+
+    def test_view_count_incremented_once(self):
+        """Test that a detail page visit increments the view count exactly once"""
+        context = self.get_context()
+
+        self.assertEqual(context['project'].views, 6)
+        self.assertEqual(Project.objects.get(pk=self.project.pk).views, 6)
+
+    def test_user_has_liked_comes_from_the_project_query(self):
+        """Test that the like check is answered by the annotated project row"""
+        self.project.likes.add(self.user)
+
+        with self.assertNumQueries(4):
+            context = self.get_context()
+
+        self.assertTrue(context['user_has_liked'])
+
+
+class UserPortfolioViewTests(BaseTestCase):
+    """Test cases for user portfolio view"""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        SkillFactory.create_batch(2, user=cls.user)
+        AchievementFactory.create_batch(6, user=cls.user)
+        TestimonialFactory.create_batch(2, user=cls.user, project=None)
+
+    def get_context(self):
+        request = RequestFactory().get('/user/')
+        with patch('portfolio.views.render', return_value=HttpResponse()) as render:
+            user_portfolio(request, username=self.user.username)
+        return render.call_args.args[2]
+
+    def test_portfolio_sections_are_prefetched(self):
+        """Test portfolio sections render without further queries"""
+        context = self.get_context()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(len(context['skills']), 2)
+            self.assertIn('percentage', context['skills'][0])
+            self.assertEqual(len(context['achievements']), 5)
+            self.assertEqual(len(context['testimonials']), 2)
+            list(context['experience'])
+            list(context['education'])
+
+
+class LikeProjectViewTests(BaseTestCase):
+    """Test cases for like_project view"""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.project = ProjectFactory()
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_login(self.user)
+
+    def toggle_like(self):
+        return self.client.post(
+            cached_reverse('portfolio:like_project'), {'project_id': self.project.pk}
+        ).json()
+
+    def test_like_toggles_and_reports_count(self):
+        """Test liking then unliking a project updates the stored like count"""
+        self.assertEqual(self.toggle_like(), {'liked': True, 'like_count': 1})
+        self.assertTrue(self.project.likes.filter(pk=self.user.pk).exists())
+
+        self.assertEqual(self.toggle_like(), {'liked': False, 'like_count': 0})
+        self.assertEqual(Project.objects.get(pk=self.project.pk).like_count, 0)
+
+    def test_like_toggle_queries(self):
+        """Test that a toggle is a delete, a savepointed insert when liking, and a count update and read"""
+        url = cached_reverse('portfolio:like_project')
+        for liked, expected_queries in ((True, 6), (False, 3)):
+            with self.subTest(liked=liked):
+                # Plus the signed-in user lookup, and the outer savepoint and its release
+                with self.assertNumQueries(expected_queries + 3):
+                    self.client.post(url, {'project_id': self.project.pk})
+
+    def test_like_unknown_project_returns_404(self):
+        """Test that liking a missing or malformed project id is a 404 and stores nothing"""
+        url = cached_reverse('portfolio:like_project')
+        for project_id in (self.project.pk + 1000, 'not-a-number'):
+            with self.subTest(project_id=project_id):
+                response = self.client.post(url, {'project_id': project_id})
+                self.assertEqual(response.status_code, 404)
+        self.assertFalse(Project.likes.through.objects.exists())
+
+    def test_like_requires_post(self):
+        """Test that GET requests are rejected"""
+        response = self.client.get(cached_reverse('portfolio:like_project'))
+        self.assertEqual(response.status_code, 405)
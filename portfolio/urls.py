@@ -4,9 +4,10 @@ from . import views
 app_name = 'portfolio'
 
 urlpatterns = [
+    # Most frequently hit routes first; the resolver stops at the first match
     path('', views.home, name='home'),
-    path('projects/', views.ProjectListView.as_view(), name='project_list'),
     path('projects/<slug:slug>/', views.ProjectDetailView.as_view(), name='project_detail'),
+    path('projects/', views.ProjectListView.as_view(), name='project_list'),
     path('category/<slug:slug>/', views.category_detail, name='category_detail'),
     path('user/<str:username>/', views.user_portfolio, name='user_portfolio'),
     path('about/', views.about, name='about'),
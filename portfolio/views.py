@@ -1,27 +1,56 @@
+import hashlib
+import time
+
 from django.shortcuts import render, get_object_or_404
 from django.views.generic import ListView, DetailView
+from django.core.cache import cache
 from django.core.paginator import Paginator
-from django.db.models import Q, Count
-from django.http import JsonResponse
+from django.db import connection
+from django.db.models import Q, F, Count, Exists, OuterRef, Prefetch
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.http import Http404, JsonResponse
 from django.contrib.auth.decorators import login_required
+from django.views.decorators.http import require_POST
+from django.utils.functional import cached_property
 from django.contrib.auth import get_user_model
-from .models import Project, Category, Skill, Experience, Education, Achievement, Testimonial
+from core.paginator import CachedApproxCountPaginator
+from .models import Project, Category, Skill, Achievement, Testimonial
+from .cache_keys import (
+    HOME_CONTEXT_CACHE_KEY, HOME_CONTEXT_CACHE_TIMEOUT,
+    ABOUT_CONTEXT_CACHE_KEY, ABOUT_CONTEXT_CACHE_TIMEOUT,
+    PROJECT_LIST_CACHE_PREFIX, PROJECT_LIST_CACHE_TIMEOUT, PROJECT_LIST_CACHE_VERSION_KEY,
+)
 
 User = get_user_model()
 
+# Query parameters that select which projects a list page shows
+PROJECT_LIST_FILTER_PARAMS = ('q', 'category', 'user', 'status', 'sort')
 
-def home(request):
-    """Homepage view"""
+# Columns project cards render; description, technologies and the search vector stay deferred
+PROJECT_LISTING_FIELDS = (
+    'id', 'title', 'slug', 'short_description', 'featured_image', 'status',
+    'is_featured', 'views', 'like_count', 'created_at',
+    'category', 'category__name', 'category__slug',
+    'user', 'user__username', 'user__first_name', 'user__last_name',
+)
+
+
+def published_projects():
+    """Published projects with the relations listing templates render"""
+    return Project.objects.filter(is_published=True).select_related(
+        'category', 'user'
+    ).prefetch_related('tags').only(*PROJECT_LISTING_FIELDS)
+
+
+def get_home_context():
+    """Featured listings for the homepage, materialized so they can be cached"""
     # Get featured projects
-    featured_projects = Project.objects.filter(
-        is_featured=True, 
-        is_published=True
+    featured_projects = published_projects().filter(
+        is_featured=True
     ).order_by('-created_at')[:6]
     
     # Get recent projects
-    recent_projects = Project.objects.filter(
-        is_published=True
-    ).order_by('-created_at')[:8]
+    recent_projects = published_projects().order_by('-created_at')[:8]
     
     # Get categories with project counts
     categories = Category.objects.annotate(
@@ -30,22 +59,27 @@ def home(request):
     
     # Get featured users/developers
     featured_users = User.objects.filter(
+        Exists(Project.objects.filter(user=OuterRef('pk'), is_published=True)),
         is_active=True,
-        projects__isnull=False
-    ).distinct().order_by('-date_joined')[:6]
+    ).order_by('-date_joined')[:6]
     
     # Get testimonials
     testimonials = Testimonial.objects.filter(
         is_featured=True
     ).order_by('-created_at')[:5]
     
-    context = {
-        'featured_projects': featured_projects,
-        'recent_projects': recent_projects,
-        'categories': categories,
-        'featured_users': featured_users,
-        'testimonials': testimonials,
+    return {
+        'featured_projects': list(featured_projects),
+        'recent_projects': list(recent_projects),
+        'categories': list(categories),
+        'featured_users': list(featured_users),
+        'testimonials': list(testimonials),
     }
+
+
+def home(request):
+    """Homepage view"""
+    context = cache.get_or_set(HOME_CONTEXT_CACHE_KEY, get_home_context, HOME_CONTEXT_CACHE_TIMEOUT)
     return render(request, 'portfolio/home.html', context)
 
 
@@ -55,18 +89,27 @@ class ProjectListView(ListView):
     template_name = 'portfolio/project_list.html'
     context_object_name = 'projects'
     paginate_by = 12
+    paginator_class = CachedApproxCountPaginator
     
     def get_queryset(self):
-        queryset = Project.objects.filter(is_published=True)
+        queryset = published_projects()
         
         # Search functionality
         query = self.request.GET.get('q')
         if query:
+            if connection.vendor == 'postgresql':
+                # GIN index probe on the trigger-maintained search vector
+                text_match = Q(search_vector=SearchQuery(
+                    query, config='english', search_type='websearch'
+                ))
+            else:
+                text_match = (
+                    Q(title__icontains=query) |
+                    Q(description__icontains=query) |
+                    Q(technologies__icontains=query)
+                )
             queryset = queryset.filter(
-                Q(title__icontains=query) |
-                Q(description__icontains=query) |
-                Q(technologies__icontains=query) |
-                Q(tags__name__icontains=query)
+                text_match | Q(tags__name__icontains=query)
             ).distinct()
         
         # Category filtering
@@ -91,9 +134,42 @@ class ProjectListView(ListView):
         
         return queryset
     
+    @cached_property
+    def list_cache_version(self):
+        return cache.get_or_set(PROJECT_LIST_CACHE_VERSION_KEY, time.time_ns, None)
+    
+    def get_list_cache_key(self, page_number):
+        params = '&'.join(
+            f'{name}={self.request.GET.get(name, "")}' for name in PROJECT_LIST_FILTER_PARAMS
+        )
+        digest = hashlib.md5(params.encode(), usedforsecurity=False).hexdigest()
+        return f'{PROJECT_LIST_CACHE_PREFIX}:{self.list_cache_version}:{digest}:{page_number}'
+    
+    def get_paginator(self, queryset, per_page, **kwargs):
+        # The count is cached under the same version as the page ids
+        return super().get_paginator(
+            queryset, per_page,
+            cache_timeout=PROJECT_LIST_CACHE_TIMEOUT,
+            cache_prefix=f'{PROJECT_LIST_CACHE_PREFIX}_count:{self.list_cache_version}',
+            **kwargs,
+        )
+    
+    def paginate_queryset(self, queryset, page_size):
+        paginator, page, object_list, is_paginated = super().paginate_queryset(queryset, page_size)
+        cache_key = self.get_list_cache_key(page.number)
+        project_ids = cache.get(cache_key)
+        if project_ids is None:
+            page.object_list = list(page.object_list)
+            cache.set(cache_key, [project.pk for project in page.object_list], PROJECT_LIST_CACHE_TIMEOUT)
+        else:
+            # Hydrate just this page, keeping the cached order
+            projects = published_projects().in_bulk(project_ids)
+            page.object_list = [projects[pk] for pk in project_ids if pk in projects]
+        return paginator, page, page.object_list, is_paginated
+    
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['categories'] = Category.objects.all()
+        context['categories'] = Category.get_all()
         context['current_category'] = self.request.GET.get('category', '')
         context['current_query'] = self.request.GET.get('q', '')
         context['current_sort'] = self.request.GET.get('sort', '-created_at')
@@ -106,16 +182,30 @@ class ProjectDetailView(DetailView):
     template_name = 'portfolio/project_detail.html'
     context_object_name = 'project'
     
-    def get_object(self):
-        obj = super().get_object()
-        # Increment view count
-        obj.views += 1
-        obj.save(update_fields=['views'])
-        return obj
+    def get_queryset(self):
+        queryset = Project.objects.select_related('category', 'user').prefetch_related(
+            'testimonials', 'tags'
+        )
+        if self.request.user.is_authenticated:
+            # Answer "has this user liked it" in the same SELECT as the project
+            queryset = queryset.annotate(user_liked=Exists(
+                Project.likes.through.objects.filter(
+                    project_id=OuterRef('pk'), user_id=self.request.user.pk
+                )
+            ))
+        return queryset
+    
+    def get(self, request, *args, **kwargs):
+        self.object = self.get_object()
+        # Increment view count in a single UPDATE, then mirror it on the loaded instance
+        Project.objects.filter(pk=self.object.pk).update(views=F('views') + 1)
+        self.object.views += 1
+        context = self.get_context_data(object=self.object)
+        return self.render_to_response(context)
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        project = self.get_object()
+        project = self.object
         
         # Get related projects
         context['related_projects'] = Project.objects.filter(
@@ -128,9 +218,7 @@ class ProjectDetailView(DetailView):
         
         # Check if user has liked this project
         if self.request.user.is_authenticated:
-            context['user_has_liked'] = project.likes.filter(
-                pk=self.request.user.pk
-            ).exists()
+            context['user_has_liked'] = project.user_liked
         
         return context
 
@@ -138,9 +226,8 @@ class ProjectDetailView(DetailView):
 def category_detail(request, slug):
     """Category detail view showing projects in that category"""
     category = get_object_or_404(Category, slug=slug)
-    projects = Project.objects.filter(
-        category=category,
-        is_published=True
+    projects = published_projects().filter(
+        category=category
     ).order_by('-created_at')
     
     paginator = Paginator(projects, 12)
@@ -157,29 +244,22 @@ def category_detail(request, slug):
 
 def user_portfolio(request, username):
     """Individual user portfolio view"""
-    user = get_object_or_404(User, username=username)
+    # Load the user and their portfolio sections as one prefetch chain
+    user = get_object_or_404(
+        User.objects.prefetch_related(
+            'experiences',
+            'education',
+            Prefetch('achievements', queryset=Achievement.objects.all()[:5], to_attr='recent_achievements'),
+            Prefetch('testimonials', queryset=Testimonial.objects.all()[:5], to_attr='recent_testimonials'),
+        ),
+        username=username,
+    )
     
-    # Get user's projects
-    projects = Project.objects.filter(
-        user=user,
-        is_published=True
+    # Get user's projects (paginated in the database rather than prefetched)
+    projects = published_projects().filter(
+        user=user
     ).order_by('-created_at')
     
-    # Get user's skills
-    skills = Skill.objects.filter(user=user).order_by('-percentage')
-    
-    # Get user's experience
-    experience = Experience.objects.filter(user=user)
-    
-    # Get user's education
-    education = Education.objects.filter(user=user)
-    
-    # Get user's achievements
-    achievements = Achievement.objects.filter(user=user)[:5]
-    
-    # Get user's testimonials
-    testimonials = Testimonial.objects.filter(user=user)[:5]
-    
     # Paginate projects
     paginator = Paginator(projects, 9)
     page_number = request.GET.get('page')
@@ -188,17 +268,21 @@ def user_portfolio(request, username):
     context = {
         'portfolio_user': user,
         'projects': projects_page,
-        'skills': skills,
-        'experience': experience,
-        'education': education,
-        'achievements': achievements,
-        'testimonials': testimonials,
+        # Skills are plain display data; experience, education and testimonials keep
+        # their model instances for duration, get_degree_display and image URLs
+        'skills': list(Skill.objects.filter(user=user).values(
+            'name', 'proficiency', 'percentage', 'icon', 'category'
+        )),
+        'experience': user.experiences.all(),
+        'education': user.education.all(),
+        'achievements': user.recent_achievements,
+        'testimonials': user.recent_testimonials,
     }
     return render(request, 'portfolio/user_portfolio.html', context)
 
 
-def about(request):
-    """About page"""
+def get_about_context():
+    """Site statistics and featured developers for the about page"""
     # Get some statistics
     stats = {
         'total_projects': Project.objects.filter(is_published=True).count(),
@@ -212,39 +296,38 @@ def about(request):
     
     # Get featured developers
     featured_developers = User.objects.filter(
-        is_active=True,
-        projects__isnull=False
+        is_active=True
     ).annotate(
-        project_count=Count('projects')
-    ).order_by('-project_count')[:8]
+        project_count=Count('projects', filter=Q(projects__is_published=True))
+    ).filter(project_count__gt=0).order_by('-project_count')[:8]
     
-    context = {
+    return {
         'stats': stats,
-        'featured_developers': featured_developers,
+        'featured_developers': list(featured_developers),
     }
+
+
+def about(request):
+    """About page"""
+    context = cache.get_or_set(ABOUT_CONTEXT_CACHE_KEY, get_about_context, ABOUT_CONTEXT_CACHE_TIMEOUT)
     return render(request, 'portfolio/about.html', context)
 
 
+@require_POST
 @login_required
 def like_project(request):
     """AJAX view to like/unlike projects"""
-    if request.method == 'POST':
-        project_id = request.POST.get('project_id')
-        project = get_object_or_404(Project, id=project_id)
-        
-        if project.likes.filter(pk=request.user.pk).exists():
-            project.likes.remove(request.user)
-            liked = False
-        else:
-            project.likes.add(request.user)
-            liked = True
-        
-        return JsonResponse({
-            'liked': liked,
-            'like_count': project.like_count
-        })
+    try:
+        project_id = int(request.POST.get('project_id'))
+    except (TypeError, ValueError):
+        raise Http404('No project matches the given query.')
+    
+    try:
+        liked, like_count = Project.toggle_like(project_id, request.user.pk)
+    except Project.DoesNotExist:
+        raise Http404('No project matches the given query.')
     
-    return JsonResponse({'error': 'Invalid request'}, status=400)
+    return JsonResponse({'liked': liked, 'like_count': like_count})
 
 
 def search(request):
@@ -253,15 +336,24 @@ def search(request):
     category = request.GET.get('category', '')
     user_filter = request.GET.get('user', '')
     
-    projects = Project.objects.filter(is_published=True)
+    projects = published_projects()
+    ordering = ['-created_at']
     
     if query:
-        projects = projects.filter(
-            Q(title__icontains=query) |
-            Q(description__icontains=query) |
-            Q(technologies__icontains=query) |
-            Q(short_description__icontains=query)
-        )
+        if connection.vendor == 'postgresql':
+            # Title matches (weight A) rank above description and technology matches
+            search_query = SearchQuery(query, config='english', search_type='websearch')
+            projects = projects.filter(search_vector=search_query).annotate(
+                rank=SearchRank(F('search_vector'), search_query)
+            )
+            ordering.insert(0, '-rank')
+        else:
+            projects = projects.filter(
+                Q(title__icontains=query) |
+                Q(description__icontains=query) |
+                Q(technologies__icontains=query) |
+                Q(short_description__icontains=query)
+            )
     
     if category:
         projects = projects.filter(category__slug=category)
@@ -269,18 +361,18 @@ def search(request):
     if user_filter:
         projects = projects.filter(user__username=user_filter)
     
-    projects = projects.order_by('-created_at')
+    projects = projects.order_by(*ordering)
     
-    paginator = Paginator(projects, 12)
+    paginator = ApproxCountPaginator(projects, 12)
     page_number = request.GET.get('page')
     page_obj = paginator.get_page(page_number)
     
     context = {
         'page_obj': page_obj,
         'query': query,
-        'categories': Category.objects.all(),
+        'categories': Category.get_all(),
         'current_category': category,
         'current_user': user_filter,
-        'total_results': projects.count(),
+        'total_results': paginator.count,
     }
     return render(request, 'portfolio/search_results.html', context)
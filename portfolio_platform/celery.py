@@ -0,0 +1,20 @@
+"""
+Celery application for portfolio_platform project.
+
+Workers are started with:
+    celery -A portfolio_platform worker -Q email_queue --concurrency=2
+"""
+
+import os
+
+from celery import Celery
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'portfolio_platform.settings')
+
+app = Celery('portfolio_platform')
+
+# Read CELERY_* settings from Django settings
+app.config_from_object('django.conf:settings', namespace='CELERY')
+
+# Discover tasks.py modules in installed apps
+app.autodiscover_tasks()
@@ -152,12 +152,19 @@ MEDIA_ROOT = BASE_DIR / 'media'
 # Custom User Model
 AUTH_USER_MODEL = 'users.User'
 
+# Users sign in with their email address
+AUTHENTICATION_BACKENDS = [
+    'users.backends.EmailBackend',
+]
+
 # Login/Logout URLs
 LOGIN_URL = '/users/login/'
 LOGIN_REDIRECT_URL = '/dashboard/'
 LOGOUT_REDIRECT_URL = '/'
 
 # Messages
+# Flash messages are short one-liners, so keep them in a cookie and never touch the session
+MESSAGE_STORAGE = 'django.contrib.messages.storage.cookie.CookieStorage'
 MESSAGE_TAGS = {
     messages.DEBUG: 'alert-secondary',
     messages.INFO: 'alert-info',
@@ -201,6 +208,38 @@ EMAIL_USE_TLS = config('EMAIL_USE_TLS', default=True, cast=bool)
 EMAIL_HOST_USER = config('EMAIL_HOST_USER', default='')
 EMAIL_HOST_PASSWORD = config('EMAIL_HOST_PASSWORD', default='')
 
+# Celery Configuration
+CELERY_BROKER_URL = config('CELERY_BROKER_URL', default='redis://localhost:6379/0')
+CELERY_RESULT_BACKEND = config('CELERY_RESULT_BACKEND', default=None)
+CELERY_TASK_IGNORE_RESULT = True
+CELERY_TASK_ROUTES = {
+    # Run email workers on their own queue: celery -A portfolio_platform worker -Q email_queue --concurrency=2
+    'contact.tasks.*': {'queue': 'email_queue'},
+}
+
+# Logging
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'verbose': {
+            'format': '{levelname} {asctime} {name} {message}',
+            'style': '{',
+        },
+    },
+    'handlers': {
+        'console': {
+            # Writes happen on a background thread, off the request cycle
+            'class': 'core.log_handlers.QueueStreamHandler',
+            'formatter': 'verbose',
+        },
+    },
+    'loggers': {
+        app: {'handlers': ['console'], 'level': 'INFO', 'propagate': False}
+        for app in ['core', 'users', 'portfolio', 'blog', 'contact']
+    },
+}
+
 # Debug Toolbar
 INTERNAL_IPS = [
     '127.0.0.1',
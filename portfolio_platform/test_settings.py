@@ -62,6 +62,9 @@ CACHES = {
     }
 }
 
+# Keep sessions in signed cookies so authenticated requests skip the session table
+SESSION_ENGINE = 'django.contrib.sessions.backends.signed_cookies'
+
 # Test-specific settings
 TEST_RUNNER = 'django.test.runner.DiscoverRunner'
 
@@ -0,0 +1,36 @@
+"""
+Authentication backends for the users app
+"""
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+
+UserModel = get_user_model()
+
+
+class EmailBackend(ModelBackend):
+    """Authenticate with a case-insensitive email address and password in one query"""
+
+    def authenticate(self, request, username=None, password=None, email=None, **kwargs):
+        email = email or username
+        if email is None or password is None:
+            return None
+        
+        user = UserModel._default_manager.filter(email__iexact=email).first()
+        if user is None:
+            # Run the password hasher anyway to reduce the timing difference
+            # between existing and nonexistent users (same as ModelBackend)
+            UserModel().set_password(password)
+            return None
+        
+        if user.check_password(password) and self.user_can_authenticate(user):
+            return user
+        return None
+    
+    def get_user(self, user_id):
+        # Join the profile into the per-request user lookup so views get it for free
+        try:
+            user = UserModel._default_manager.select_related('profile').get(pk=user_id)
+        except UserModel.DoesNotExist:
+            return None
+        return user if self.user_can_authenticate(user) else None
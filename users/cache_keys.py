@@ -0,0 +1,9 @@
+"""
+Cache keys shared by the user list view and the signal handlers that invalidate it
+"""
+
+# Ordered user ids of one search results page; user changes drop the version key,
+# which moves every cached count and search page to fresh cache keys
+USER_SEARCH_CACHE_PREFIX = 'user_list_search'
+USER_SEARCH_CACHE_TIMEOUT = 30
+USER_LIST_CACHE_VERSION_KEY = 'user_list_version'
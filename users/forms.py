@@ -1,6 +1,7 @@
 from django import forms
 from django.contrib.auth.forms import UserCreationForm, UserChangeForm
 from django.contrib.auth import authenticate
+from django.db import transaction
 from .models import User, Profile
 
 
@@ -29,8 +30,10 @@ class UserRegistrationForm(UserCreationForm):
         user.first_name = self.cleaned_data['first_name']
         user.last_name = self.cleaned_data['last_name']
         if commit:
-            user.save()
-            Profile.objects.create(user=user)
+            # Never leave a user without its profile if the second INSERT fails
+            with transaction.atomic():
+                user.save()
+                Profile.objects.create(user=user)
         return user
 
 
@@ -49,19 +52,25 @@ class UserLoginForm(forms.Form):
         })
     )
     
+    def __init__(self, *args, request=None, **kwargs):
+        self.request = request
+        self.user_cache = None
+        super().__init__(*args, **kwargs)
+    
     def clean(self):
         email = self.cleaned_data.get('email')
         password = self.cleaned_data.get('password')
         
         if email and password:
-            try:
-                user = User.objects.get(email=email)
-                if not authenticate(username=user.username, password=password):
-                    raise forms.ValidationError("Invalid email or password.")
-            except User.DoesNotExist:
+            self.user_cache = authenticate(self.request, username=email, password=password)
+            if self.user_cache is None:
                 raise forms.ValidationError("Invalid email or password.")
         
         return self.cleaned_data
+    
+    def get_user(self):
+        """The user authenticated by a successful clean()"""
+        return self.user_cache
 
 
 class UserUpdateForm(forms.ModelForm):
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.5 on 2026-10-14 15:02
+
+from django.db import migrations
+
+
+# icontains compiles to UPPER(col::text) LIKE UPPER(%s) on PostgreSQL, so the
+# trigram indexes are built on that expression to be usable by the user search
+SEARCH_COLUMNS = ['username', 'first_name', 'last_name', 'bio']
+
+TRGM_INDEX_SQL = """
+CREATE INDEX IF NOT EXISTS users_user_{column}_upper_trgm
+    ON users_user USING gin ((UPPER("{column}"::text)) gin_trgm_ops);
+"""
+
+
+def create_trgm_indexes(apps, schema_editor):
+    # pg_trgm is PostgreSQL-only; other backends keep scanning for icontains
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm;')
+    for column in SEARCH_COLUMNS:
+        schema_editor.execute(TRGM_INDEX_SQL.format(column=column))
+
+
+def drop_trgm_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for column in SEARCH_COLUMNS:
+        schema_editor.execute(f'DROP INDEX IF EXISTS users_user_{column}_upper_trgm;')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trgm_indexes, drop_trgm_indexes),
+    ]
@@ -1,6 +1,6 @@
 from django.contrib.auth.models import AbstractUser
-from django.db import models
-from PIL import Image
+from django.db import models, transaction
+from PIL import Image, ImageOps
 
 
 class User(AbstractUser):
@@ -25,6 +25,12 @@ class User(AbstractUser):
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = ['username', 'first_name', 'last_name']
 
+    DEFAULT_PROFILE_PICTURE = 'default_profile.jpg'
+    PROFILE_PICTURE_MAX_SIZE = (300, 300)
+
+    # Name of the profile picture as loaded from the database (None for new instances)
+    _loaded_profile_picture = None
+
     class Meta:
         verbose_name = 'User'
         verbose_name_plural = 'Users'
@@ -37,16 +43,44 @@ class User(AbstractUser):
     def full_name(self):
         return f"{self.first_name} {self.last_name}".strip()
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        if 'profile_picture' in field_names:
+            instance._loaded_profile_picture = values[field_names.index('profile_picture')]
+        return instance
+
+    @property
+    def profile_picture_changed(self):
+        """Whether a non-default profile picture differs from the one last loaded or saved"""
+        if not self.profile_picture or self.profile_picture.name == self.DEFAULT_PROFILE_PICTURE:
+            return False
+        return (
+            not self.profile_picture._committed
+            or self.profile_picture.name != self._loaded_profile_picture
+        )
+
     def save(self, *args, **kwargs):
+        picture_changed = self.profile_picture_changed
         super().save(*args, **kwargs)
         
-        # Resize profile picture
-        if self.profile_picture and self.profile_picture.name != 'default_profile.jpg':
-            img = Image.open(self.profile_picture.path)
-            if img.height > 300 or img.width > 300:
-                output_size = (300, 300)
-                img.thumbnail(output_size)
-                img.save(self.profile_picture.path)
+        # Resize a newly uploaded profile picture in the background once the row is committed
+        if picture_changed:
+            from .tasks import queue_profile_picture_resize
+            user_id = self.pk
+            transaction.on_commit(lambda: queue_profile_picture_resize(user_id))
+        self._loaded_profile_picture = self.profile_picture.name
+
+    def resize_profile_picture(self):
+        """Shrink the profile picture in place to fit PROFILE_PICTURE_MAX_SIZE"""
+        max_width, max_height = self.PROFILE_PICTURE_MAX_SIZE
+        img = Image.open(self.profile_picture.path)
+        if img.height > max_height or img.width > max_width:
+            # Let libjpeg downscale while decoding (no-op for non-JPEG files)
+            img.draft('RGB', self.PROFILE_PICTURE_MAX_SIZE)
+            img = ImageOps.exif_transpose(img)
+            img.thumbnail(self.PROFILE_PICTURE_MAX_SIZE, Image.Resampling.LANCZOS)
+            img.save(self.profile_picture.path)
 
 
 class Profile(models.Model):
@@ -66,6 +100,13 @@ class Profile(models.Model):
 
     @property
     def skill_list(self):
-        if self.skills:
-            return [skill.strip() for skill in self.skills.split(',')]
-        return []
+        # Parsed once per skills value, so repeated template and admin access is free
+        # while edits to skills are still picked up
+        cached = self.__dict__.get('_skill_list')
+        if cached is None or cached[0] != self.skills:
+            if self.skills:
+                parsed = [skill.strip() for skill in self.skills.split(',')]
+            else:
+                parsed = []
+            cached = self.__dict__['_skill_list'] = (self.skills, parsed)
+        return cached[1]
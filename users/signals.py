@@ -0,0 +1,18 @@
+"""
+Signal handlers for the users app
+"""
+
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import User
+from .cache_keys import USER_LIST_CACHE_VERSION_KEY
+
+
+@receiver([post_save, post_delete], sender=User)
+def invalidate_user_list_cache(sender, update_fields=None, **kwargs):
+    """Move the cached user list counts and search pages to fresh keys when a user changes"""
+    # Signing in only touches last_login, which the listing doesn't show
+    if update_fields is not None and set(update_fields) == {'last_login'}:
+        return
+    cache.delete(USER_LIST_CACHE_VERSION_KEY)
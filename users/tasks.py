@@ -0,0 +1,32 @@
+"""
+Background tasks for the users app
+"""
+
+import logging
+
+from celery import shared_task
+from .models import User
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def resize_profile_picture_task(user_id):
+    """Shrink a user's profile picture after it has been uploaded"""
+    user = User.objects.only('id', 'profile_picture').filter(pk=user_id).first()
+    if user is None or user.profile_picture.name == User.DEFAULT_PROFILE_PICTURE:
+        return
+    
+    user.resize_profile_picture()
+
+
+def queue_profile_picture_resize(user_id):
+    """Queue the profile picture resize, resizing in-process if the broker is unavailable"""
+    try:
+        resize_profile_picture_task.delay(user_id)
+    except Exception:
+        logger.exception("Failed to queue profile picture resize for user %s", user_id)
+        try:
+            resize_profile_picture_task(user_id)
+        except Exception:
+            logger.exception("Failed to resize profile picture for user %s", user_id)
@@ -2,12 +2,16 @@
 Tests for Users app forms
 """
 
-from django.test import TestCase
+from django.test import SimpleTestCase
 from django.contrib.auth import get_user_model
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import IntegrityError
+from types import MappingProxyType
+from unittest.mock import patch
 
 from core.test_utils import BaseTestCase, FileTestMixin
 from core.factories import UserFactory, ProfileFactory
+from .models import Profile
 from .forms import (
     UserRegistrationForm, UserLoginForm, UserUpdateForm, 
     ProfileUpdateForm, CustomUserChangeForm
@@ -15,22 +19,23 @@ from .forms import (
 
 User = get_user_model()
 
+# Valid registration submission; tests override single fields with {**REGISTRATION_DATA, ...}
+REGISTRATION_DATA = MappingProxyType({
+    'username': 'testuser',
+    'email': 'test@example.com',
+    'first_name': 'Test',
+    'last_name': 'User',
+    'password1': 'complexpassword123',
+    'password2': 'complexpassword123'
+})
+
 
 class UserRegistrationFormTests(BaseTestCase):
     """Test cases for UserRegistrationForm"""
 
     def test_valid_registration_form(self):
         """Test form with valid data"""
-        form_data = {
-            'username': 'testuser',
-            'email': 'test@example.com',
-            'first_name': 'Test',
-            'last_name': 'User',
-            'password1': 'complexpassword123',
-            'password2': 'complexpassword123'
-        }
-        
-        form = UserRegistrationForm(data=form_data)
+        form = UserRegistrationForm(data=dict(REGISTRATION_DATA))
         self.assertTrue(form.is_valid())
 
     def test_registration_form_missing_required_fields(self):
@@ -49,16 +54,9 @@ class UserRegistrationFormTests(BaseTestCase):
 
     def test_registration_form_password_mismatch(self):
         """Test form validation with password mismatch"""
-        form_data = {
-            'username': 'testuser',
-            'email': 'test@example.com',
-            'first_name': 'Test',
-            'last_name': 'User',
-            'password1': 'complexpassword123',
-            'password2': 'differentpassword123'
-        }
-        
-        form = UserRegistrationForm(data=form_data)
+        form = UserRegistrationForm(
+            data={**REGISTRATION_DATA, 'password2': 'differentpassword123'}
+        )
         self.assertFalse(form.is_valid())
         self.assertIn('password2', form.errors)
 
@@ -67,32 +65,16 @@ class UserRegistrationFormTests(BaseTestCase):
         # Create existing user
         UserFactory(email='existing@example.com')
         
-        form_data = {
-            'username': 'newuser',
-            'email': 'existing@example.com',
-            'first_name': 'New',
-            'last_name': 'User',
-            'password1': 'complexpassword123',
-            'password2': 'complexpassword123'
-        }
-        
-        form = UserRegistrationForm(data=form_data)
+        form = UserRegistrationForm(
+            data={**REGISTRATION_DATA, 'username': 'newuser', 'email': 'existing@example.com'}
+        )
         # Note: This test depends on custom validation in the form
         # If you don't have email uniqueness validation in the form,
         # it will be caught at the database level
 
     def test_registration_form_save(self):
         """Test saving form creates user and profile"""
-        form_data = {
-            'username': 'testuser',
-            'email': 'test@example.com',
-            'first_name': 'Test',
-            'last_name': 'User',
-            'password1': 'complexpassword123',
-            'password2': 'complexpassword123'
-        }
-        
-        form = UserRegistrationForm(data=form_data)
+        form = UserRegistrationForm(data=dict(REGISTRATION_DATA))
         self.assertTrue(form.is_valid())
         
         user = form.save()
@@ -106,29 +88,55 @@ class UserRegistrationFormTests(BaseTestCase):
         # Check if profile was created (if your form creates it)
         self.assertTrue(hasattr(user, 'profile'))
 
+    def test_registration_form_save_is_atomic(self):
+        """Test that a failed profile insert does not leave an orphaned user"""
+        form = UserRegistrationForm(
+            data={**REGISTRATION_DATA, 'username': 'atomicuser', 'email': 'atomic@example.com'}
+        )
+        self.assertTrue(form.is_valid())
+        
+        with patch.object(Profile.objects, 'create', side_effect=IntegrityError):
+            with self.assertRaises(IntegrityError):
+                form.save()
+        
+        self.assertFalse(User.objects.filter(email='atomic@example.com').exists())
+
+
+class UserRegistrationFormFieldTests(SimpleTestCase):
+    """Test cases for UserRegistrationForm that need no database"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Unbound and only inspected, so one instance serves every metadata test
+        cls.unbound_registration_form = UserRegistrationForm()
+
     def test_registration_form_widget_classes(self):
         """Test that form fields have correct CSS classes"""
-        form = UserRegistrationForm()
+        form = self.unbound_registration_form
         
         for field_name, field in form.fields.items():
-            self.assertEqual(field.widget.attrs.get('class'), 'form-control')
+            with self.subTest(field=field_name):
+                self.assertEqual(field.widget.attrs.get('class'), 'form-control')
 
     def test_registration_form_help_text_removal(self):
         """Test that help text is removed from certain fields"""
-        form = UserRegistrationForm()
+        form = self.unbound_registration_form
         
         # These fields should have help_text set to None
         fields_without_help = ['username', 'password1', 'password2']
         for field_name in fields_without_help:
-            self.assertIsNone(form.fields[field_name].help_text)
+            with self.subTest(field=field_name):
+                self.assertIsNone(form.fields[field_name].help_text)
 
 
 class UserLoginFormTests(BaseTestCase):
     """Test cases for UserLoginForm"""
 
-    def setUp(self):
-        super().setUp()
-        self.test_user = UserFactory(email='login@example.com')
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.test_user = UserFactory(email='login@example.com')
 
     def test_valid_login_form(self):
         """Test form with valid credentials"""
@@ -140,6 +148,14 @@ class UserLoginFormTests(BaseTestCase):
         form = UserLoginForm(data=form_data)
         self.assertTrue(form.is_valid())
 
+    def test_login_form_authenticates_with_one_query(self):
+        """Test that a valid login looks the user up by email in a single query"""
+        form = UserLoginForm(data={'email': 'LOGIN@example.com', 'password': 'testpass123'})
+        
+        with self.assertNumQueries(1):
+            self.assertTrue(form.is_valid())
+        self.assertEqual(form.get_user(), self.test_user)
+
     def test_login_form_invalid_email(self):
         """Test form with non-existent email"""
         form_data = {
@@ -162,6 +178,10 @@ class UserLoginFormTests(BaseTestCase):
         self.assertFalse(form.is_valid())
         self.assertIn('Invalid email or password', str(form.non_field_errors()))
 
+
+class UserLoginFormFieldTests(SimpleTestCase):
+    """Test cases for UserLoginForm that need no database"""
+
     def test_login_form_missing_fields(self):
         """Test form with missing required fields"""
         # Test missing email
@@ -180,22 +200,21 @@ class UserLoginFormTests(BaseTestCase):
         """Test that form widgets have correct attributes"""
         form = UserLoginForm()
         
-        email_widget = form.fields['email'].widget
-        password_widget = form.fields['password'].widget
-        
-        self.assertEqual(email_widget.attrs['class'], 'form-control')
-        self.assertEqual(email_widget.attrs['placeholder'], 'Enter your email')
-        
-        self.assertEqual(password_widget.attrs['class'], 'form-control')
-        self.assertEqual(password_widget.attrs['placeholder'], 'Enter your password')
+        placeholders = {'email': 'Enter your email', 'password': 'Enter your password'}
+        for field_name, placeholder in placeholders.items():
+            with self.subTest(field=field_name):
+                widget = form.fields[field_name].widget
+                self.assertEqual(widget.attrs['class'], 'form-control')
+                self.assertEqual(widget.attrs['placeholder'], placeholder)
 
 
 class UserUpdateFormTests(BaseTestCase, FileTestMixin):
     """Test cases for UserUpdateForm"""
 
-    def setUp(self):
-        super().setUp()
-        self.user = UserFactory()
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.user = UserFactory()
 
     def test_valid_user_update_form(self):
         """Test form with valid update data"""
@@ -247,17 +266,6 @@ class UserUpdateFormTests(BaseTestCase, FileTestMixin):
         self.assertFalse(form.is_valid())
         self.assertIn('email', form.errors)
 
-    def test_user_update_form_required_fields(self):
-        """Test that required fields are enforced"""
-        form_data = {}  # Empty data
-        
-        form = UserUpdateForm(data=form_data, instance=self.user)
-        self.assertFalse(form.is_valid())
-        
-        required_fields = ['username', 'email', 'first_name', 'last_name']
-        for field in required_fields:
-            self.assertIn(field, form.errors)
-
     def test_user_update_form_save(self):
         """Test saving form updates user"""
         form_data = {
@@ -271,7 +279,8 @@ class UserUpdateFormTests(BaseTestCase, FileTestMixin):
         form = UserUpdateForm(data=form_data, instance=self.user)
         self.assertTrue(form.is_valid())
         
-        updated_user = form.save()
+        # The assertions only read the returned instance, so skip the UPDATE
+        updated_user = form.save(commit=False)
         
         self.assertEqual(updated_user.username, 'newusername')
         self.assertEqual(updated_user.email, 'newemail@example.com')
@@ -280,13 +289,34 @@ class UserUpdateFormTests(BaseTestCase, FileTestMixin):
         self.assertEqual(updated_user.bio, 'New bio')
 
 
+class UserUpdateFormFieldTests(SimpleTestCase):
+    """Test cases for UserUpdateForm that need no database"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.user = UserFactory.build()
+
+    def test_user_update_form_required_fields(self):
+        """Test that required fields are enforced"""
+        form_data = {}  # Empty data
+        
+        form = UserUpdateForm(data=form_data, instance=self.user)
+        self.assertFalse(form.is_valid())
+        
+        required_fields = ['username', 'email', 'first_name', 'last_name']
+        for field in required_fields:
+            self.assertIn(field, form.errors)
+
+
 class ProfileUpdateFormTests(BaseTestCase, FileTestMixin):
     """Test cases for ProfileUpdateForm"""
 
-    def setUp(self):
-        super().setUp()
-        self.user = UserFactory()
-        self.profile = ProfileFactory(user=self.user)
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.user = UserFactory()
+        cls.profile = ProfileFactory(user=cls.user)
 
     def test_valid_profile_update_form(self):
         """Test form with valid profile data"""
@@ -338,30 +368,6 @@ class ProfileUpdateFormTests(BaseTestCase, FileTestMixin):
             'Python, Django, JavaScript, React'
         )
 
-    def test_profile_update_form_date_validation(self):
-        """Test date field validation"""
-        # Test with invalid date
-        form_data = {
-            'date_of_birth': 'invalid-date',
-            'is_available_for_hire': True,
-        }
-        
-        form = ProfileUpdateForm(data=form_data, instance=self.profile)
-        self.assertFalse(form.is_valid())
-        self.assertIn('date_of_birth', form.errors)
-
-    def test_profile_update_form_hourly_rate_validation(self):
-        """Test hourly rate field validation"""
-        # Test with invalid decimal
-        form_data = {
-            'hourly_rate': 'not-a-number',
-            'is_available_for_hire': True,
-        }
-        
-        form = ProfileUpdateForm(data=form_data, instance=self.profile)
-        self.assertFalse(form.is_valid())
-        self.assertIn('hourly_rate', form.errors)
-
     def test_profile_update_form_optional_fields(self):
         """Test that most fields are optional"""
         form_data = {
@@ -385,7 +391,7 @@ class ProfileUpdateFormTests(BaseTestCase, FileTestMixin):
         form = ProfileUpdateForm(data=form_data, instance=self.profile)
         self.assertTrue(form.is_valid())
         
-        updated_profile = form.save()
+        updated_profile = form.save(commit=False)
         
         self.assertEqual(updated_profile.phone, '+9876543210')
         self.assertEqual(updated_profile.company, 'Updated Company')
@@ -395,19 +401,53 @@ class ProfileUpdateFormTests(BaseTestCase, FileTestMixin):
         self.assertEqual(updated_profile.hourly_rate, 200.00)
 
 
+class ProfileUpdateFormFieldTests(SimpleTestCase):
+    """Test cases for ProfileUpdateForm that need no database"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.profile = ProfileFactory.build()
+
+    def test_profile_update_form_date_validation(self):
+        """Test date field validation"""
+        # Test with invalid date
+        form_data = {
+            'date_of_birth': 'invalid-date',
+            'is_available_for_hire': True,
+        }
+        
+        form = ProfileUpdateForm(data=form_data, instance=self.profile)
+        self.assertFalse(form.is_valid())
+        self.assertIn('date_of_birth', form.errors)
+
+    def test_profile_update_form_hourly_rate_validation(self):
+        """Test hourly rate field validation"""
+        # Test with invalid decimal
+        form_data = {
+            'hourly_rate': 'not-a-number',
+            'is_available_for_hire': True,
+        }
+        
+        form = ProfileUpdateForm(data=form_data, instance=self.profile)
+        self.assertFalse(form.is_valid())
+        self.assertIn('hourly_rate', form.errors)
+
+
 class CustomUserChangeFormTests(BaseTestCase):
     """Test cases for CustomUserChangeForm (admin form)"""
 
-    def setUp(self):
-        super().setUp()
-        self.user = UserFactory()
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.user = UserFactory()
 
     def test_custom_user_change_form_meta(self):
         """Test that form includes all fields"""
         form = CustomUserChangeForm(instance=self.user)
         
         # Should include all User model fields
-        self.assertEqual(form._meta.model, User)
+        self.assertIs(form._meta.model, User)
         self.assertEqual(form._meta.fields, '__all__')
 
     def test_custom_user_change_form_initialization(self):
@@ -422,19 +462,18 @@ class CustomUserChangeFormTests(BaseTestCase):
 class FormIntegrationTests(BaseTestCase):
     """Integration tests for forms working together"""
 
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.workflow_user = UserFactory()
+        cls.workflow_profile = ProfileFactory(user=cls.workflow_user)
+
     def test_registration_to_update_workflow(self):
         """Test user registration followed by profile update"""
         # Register user
-        registration_data = {
-            'username': 'workflowuser',
-            'email': 'workflow@example.com',
-            'first_name': 'Workflow',
-            'last_name': 'User',
-            'password1': 'complexpassword123',
-            'password2': 'complexpassword123'
-        }
-        
-        registration_form = UserRegistrationForm(data=registration_data)
+        registration_form = UserRegistrationForm(
+            data={**REGISTRATION_DATA, 'username': 'workflowuser', 'email': 'workflow@example.com'}
+        )
         self.assertTrue(registration_form.is_valid())
         user = registration_form.save()
         
@@ -455,8 +494,8 @@ class FormIntegrationTests(BaseTestCase):
 
     def test_user_and_profile_forms_together(self):
         """Test updating user and profile forms in same workflow"""
-        user = UserFactory()
-        profile = ProfileFactory(user=user)
+        user = self.workflow_user
+        profile = self.workflow_profile
         
         # Update user
         user_data = {
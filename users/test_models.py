@@ -2,63 +2,72 @@
 Tests for Users app models
 """
 
-from django.test import TestCase
+from django.test import SimpleTestCase
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
-from django.db import IntegrityError
+from django.db import IntegrityError, transaction
 from django.core.files.uploadedfile import SimpleUploadedFile
+from datetime import date, timedelta
+from decimal import Decimal
+from types import MappingProxyType
 from unittest.mock import patch, Mock
 import os
 import tempfile
 
-from core.test_utils import BaseTestCase, FileTestMixin, override_media_root
-from core.factories import UserFactory, ProfileFactory
+from PIL import Image
 
-User = get_user_model()
+from core.test_utils import (
+    BaseTestCase, FileTestMixin, override_in_memory_storage, override_media_root
+)
+from blog.models import Post
+from core.factories import UserFactory, ProfileFactory, ProjectFactory, PostFactory
+from portfolio.models import Project
+from .models import Profile
 
+User = get_user_model()
 
-class UserModelTests(BaseTestCase):
+USER_CREATION_DATA = MappingProxyType({
+    'username': 'testuser',
+    'email': 'test@example.com',
+    'first_name': 'Test',
+    'last_name': 'User',
+    'bio': 'This is a test bio',
+    'location': 'Test City',
+    'website': 'https://testsite.com',
+    'github': 'https://github.com/testuser',
+    'linkedin': 'https://linkedin.com/in/testuser',
+    'twitter': 'https://twitter.com/testuser'
+})
+
+
+class UserModelTests(BaseTestCase, FileTestMixin):
     """Test cases for custom User model"""
 
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        # Only read in Python; TestCase hands each test its own deep copy
+        cls.john = UserFactory.build(first_name='John', last_name='Doe', email='john@example.com')
+
     def test_user_creation(self):
         """Test creating a user with all fields"""
-        user = UserFactory(
-            username='testuser',
-            email='test@example.com',
-            first_name='Test',
-            last_name='User',
-            bio='This is a test bio',
-            location='Test City',
-            website='https://testsite.com',
-            github='https://github.com/testuser',
-            linkedin='https://linkedin.com/in/testuser',
-            twitter='https://twitter.com/testuser'
-        )
+        user = UserFactory(**USER_CREATION_DATA)
         
-        self.assertEqual(user.username, 'testuser')
-        self.assertEqual(user.email, 'test@example.com')
-        self.assertEqual(user.first_name, 'Test')
-        self.assertEqual(user.last_name, 'User')
-        self.assertEqual(user.bio, 'This is a test bio')
-        self.assertEqual(user.location, 'Test City')
-        self.assertEqual(user.website, 'https://testsite.com')
+        for field, value in USER_CREATION_DATA.items():
+            with self.subTest(field=field):
+                self.assertEqual(getattr(user, field), value)
         self.assertTrue(user.is_active)
         self.assertFalse(user.is_staff)
         self.assertFalse(user.is_superuser)
 
     def test_user_str_method(self):
         """Test User model __str__ method"""
-        user = UserFactory(
-            first_name='John',
-            last_name='Doe',
-            email='john@example.com'
-        )
         expected_str = "John Doe (john@example.com)"
-        self.assertEqual(str(user), expected_str)
+        self.assertEqual(str(self.john), expected_str)
 
     def test_user_full_name_property(self):
         """Test User model full_name property"""
-        user = UserFactory(first_name='John', last_name='Doe')
+        user = User(first_name='John', last_name='Doe')
         self.assertEqual(user.full_name, 'John Doe')
         
         # Test with empty last name
@@ -74,22 +83,13 @@ class UserModelTests(BaseTestCase):
         """Test that user email must be unique"""
         UserFactory(email='unique@example.com')
         
-        with self.assertRaises(IntegrityError):
+        with self.assertRaises(IntegrityError), transaction.atomic():
             UserFactory(email='unique@example.com')
 
-    def test_user_username_field(self):
-        """Test that EMAIL is the USERNAME_FIELD"""
-        self.assertEqual(User.USERNAME_FIELD, 'email')
-
-    def test_user_required_fields(self):
-        """Test REQUIRED_FIELDS setting"""
-        expected_fields = ['username', 'first_name', 'last_name']
-        self.assertEqual(User.REQUIRED_FIELDS, expected_fields)
-
-    @override_media_root
+    @override_in_memory_storage
     def test_user_profile_picture_upload(self):
         """Test user profile picture upload"""
-        user = UserFactory()
+        user = self.user
         
         # Create test image
         image_content = b'fake image content'
@@ -104,33 +104,83 @@ class UserModelTests(BaseTestCase):
         
         self.assertTrue(user.profile_picture.name.startswith('profile_pics/'))
 
-    def test_user_verification_status(self):
-        """Test user verification functionality"""
-        user = UserFactory(is_verified=False)
+    @override_media_root
+    def test_large_profile_picture_resized(self):
+        """Test that a new oversized profile picture is shrunk to fit"""
+        with self.captureOnCommitCallbacks(execute=True):
+            user = UserFactory(
+                profile_picture=self.create_image_file('large.jpg', size=(600, 400), fast=False)
+            )
+        
+        with Image.open(user.profile_picture.path) as img:
+            self.assertEqual(img.size, (300, 200))
+
+    @override_media_root
+    def test_profile_picture_resized_in_process_when_broker_is_down(self):
+        """Test that a failed task dispatch falls back to resizing during the request"""
+        with patch(
+            'users.tasks.resize_profile_picture_task.delay', side_effect=OSError
+        ), self.assertLogs('users.tasks', 'ERROR'):
+            with self.captureOnCommitCallbacks(execute=True):
+                user = UserFactory(
+                    profile_picture=self.create_image_file('large.jpg', size=(600, 400), fast=False)
+                )
+        
+        with Image.open(user.profile_picture.path) as img:
+            self.assertEqual(img.size, (300, 200))
+
+    def test_save_without_picture_change_skips_resize(self):
+        """Test that saving other fields does not reprocess the profile picture"""
+        user = User.objects.get(pk=self.user.pk)
+        
+        self.assertFalse(user.profile_picture_changed)
+        with self.captureOnCommitCallbacks() as callbacks:
+            user.bio = 'Updated bio'
+            user.save()
+        
+        self.assertEqual(callbacks, [])
+
+    def test_user_status_updates_saved(self):
+        """Test that verification and active status changes are saved"""
+        user = self.user
         self.assertFalse(user.is_verified)
+        self.assertTrue(user.is_active)
         
-        user.is_verified = True
-        user.save()
-        self.assertTrue(user.is_verified)
+        for field, value in [('is_verified', True), ('is_active', False)]:
+            with self.subTest(field=field):
+                setattr(user, field, value)
+                user.save()
+                self.assertEqual(
+                    User.objects.values_list(field, flat=True).get(pk=user.pk), value
+                )
 
     def test_user_timestamps(self):
         """Test user creation and update timestamps"""
-        user = UserFactory()
+        user = self.user
         
         self.assertIsNotNone(user.created_at)
         self.assertIsNotNone(user.updated_at)
         
-        # Test that updated_at changes when user is updated
-        original_updated = user.updated_at
+        # Test that updated_at changes when user is updated; the clock is pinned
+        # so the comparison never depends on two saves landing on different ticks
+        original_created = user.created_at
+        later = user.updated_at + timedelta(seconds=1)
         user.bio = 'Updated bio'
-        user.save()
+        with patch('django.utils.timezone.now', return_value=later):
+            user.save()
         
-        self.assertGreater(user.updated_at, original_updated)
+        self.assertEqual(user.updated_at, later)
+        self.assertEqual(user.created_at, original_created)
 
 
 class ProfileModelTests(BaseTestCase, FileTestMixin):
     """Test cases for Profile model"""
 
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.profile = ProfileFactory(user=UserFactory(first_name='John', last_name='Doe'))
+
     def test_profile_creation(self):
         """Test creating a profile"""
         user = UserFactory()
@@ -154,18 +204,12 @@ class ProfileModelTests(BaseTestCase, FileTestMixin):
 
     def test_profile_str_method(self):
         """Test Profile model __str__ method"""
-        user = UserFactory(first_name='John', last_name='Doe')
-        profile = ProfileFactory(user=user)
         expected_str = "John Doe's Profile"
-        self.assertEqual(str(profile), expected_str)
+        self.assertEqual(str(self.profile), expected_str)
 
     def test_profile_skill_list_property(self):
         """Test Profile model skill_list property"""
-        user = UserFactory()
-        profile = ProfileFactory(
-            user=user,
-            skills='Python, Django, JavaScript, React'
-        )
+        profile = Profile(skills='Python, Django, JavaScript, React')
         
         expected_skills = ['Python', 'Django', 'JavaScript', 'React']
         self.assertEqual(profile.skill_list, expected_skills)
@@ -179,22 +223,28 @@ class ProfileModelTests(BaseTestCase, FileTestMixin):
         expected_skills = ['Python', 'Django', 'JavaScript']
         self.assertEqual(profile.skill_list, expected_skills)
 
+    def test_profile_skill_list_parsed_once(self):
+        """Test that skill_list is reused until skills changes"""
+        profile = ProfileFactory.build(skills='Python, Django')
+        
+        self.assertIs(profile.skill_list, profile.skill_list)
+        
+        profile.skills = 'Go'
+        self.assertEqual(profile.skill_list, ['Go'])
+
     def test_profile_one_to_one_relationship(self):
         """Test that Profile has one-to-one relationship with User"""
-        user = UserFactory()
-        profile = ProfileFactory(user=user)
+        user = User.objects.get(pk=self.profile.user_id)
         
         # Test accessing profile from user
-        self.assertEqual(user.profile, profile)
+        self.assertEqual(user.profile, self.profile)
         
         # Test that creating another profile for same user raises error
-        with self.assertRaises(IntegrityError):
+        with self.assertRaises(IntegrityError), transaction.atomic():
             ProfileFactory(user=user)
 
     def test_profile_date_of_birth(self):
         """Test profile date of birth field"""
-        from datetime import date
-        
         user = UserFactory()
         profile = ProfileFactory(
             user=user,
@@ -203,11 +253,10 @@ class ProfileModelTests(BaseTestCase, FileTestMixin):
         
         self.assertEqual(profile.date_of_birth, date(1990, 1, 1))
 
-    @override_media_root
+    @override_in_memory_storage
     def test_profile_resume_upload(self):
         """Test profile resume upload"""
-        user = UserFactory()
-        profile = ProfileFactory(user=user)
+        profile = self.profile
         
         # Create test file
         resume_content = b'fake resume content'
@@ -242,35 +291,28 @@ class ProfileModelTests(BaseTestCase, FileTestMixin):
         self.assertIsNone(profile.date_of_birth)
         self.assertIsNone(profile.hourly_rate)
 
-    def test_profile_availability_status(self):
-        """Test profile availability for hire status"""
-        user = UserFactory()
-        profile = ProfileFactory(user=user, is_available_for_hire=True)
-        
+    def test_profile_updates_saved(self):
+        """Test that availability and hourly rate changes are saved"""
+        profile = self.profile
         self.assertTrue(profile.is_available_for_hire)
         
-        profile.is_available_for_hire = False
-        profile.save()
-        
-        self.assertFalse(profile.is_available_for_hire)
-
-    def test_profile_hourly_rate_validation(self):
-        """Test profile hourly rate field"""
-        user = UserFactory()
-        profile = ProfileFactory(user=user, hourly_rate=150.50)
-        
-        self.assertEqual(profile.hourly_rate, 150.50)
-        
-        # Test with decimal precision
-        profile.hourly_rate = 99.99
-        profile.save()
-        
-        self.assertEqual(profile.hourly_rate, 99.99)
+        for field, value in [('is_available_for_hire', False), ('hourly_rate', Decimal('99.99'))]:
+            with self.subTest(field=field):
+                setattr(profile, field, value)
+                profile.save()
+                self.assertEqual(
+                    Profile.objects.values_list(field, flat=True).get(pk=profile.pk), value
+                )
 
 
 class UserProfileIntegrationTests(BaseTestCase):
     """Integration tests for User and Profile models"""
 
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.profile = ProfileFactory(user=UserFactory(first_name='John'), company='Old Company')
+
     def test_profile_auto_creation_signal(self):
         """Test that profile is automatically created when user is created"""
         # This test assumes you have a signal to auto-create profiles
@@ -278,23 +320,24 @@ class UserProfileIntegrationTests(BaseTestCase):
         pass
 
     def test_user_deletion_cascades_to_profile(self):
-        """Test that deleting user also deletes profile"""
-        user = UserFactory()
-        profile = ProfileFactory(user=user)
-        profile_id = profile.id
+        """Test that deleting user also deletes profile and the rows they own"""
+        user = self.profile.user
+        project = ProjectFactory(user=user)
+        post = PostFactory(author=user)
+        project.likes.add(user)
+        user_id, profile_id = user.pk, self.profile.pk
         
-        # Delete user
         user.delete()
         
-        # Check that profile is also deleted
-        from users.models import Profile
-        with self.assertRaises(Profile.DoesNotExist):
-            Profile.objects.get(id=profile_id)
+        self.assertFalse(Profile.objects.filter(pk=profile_id).exists())
+        self.assertFalse(Project.objects.filter(pk=project.pk).exists())
+        self.assertFalse(Post.objects.filter(pk=post.pk).exists())
+        self.assertFalse(Project.likes.through.objects.filter(user_id=user_id).exists())
 
     def test_user_profile_update_together(self):
         """Test updating user and profile together"""
-        user = UserFactory(first_name='John')
-        profile = ProfileFactory(user=user, company='Old Company')
+        profile = self.profile
+        user = profile.user
         
         # Update both user and profile
         user.first_name = 'Jane'
@@ -303,12 +346,25 @@ class UserProfileIntegrationTests(BaseTestCase):
         profile.company = 'New Company'
         profile.save()
         
-        # Refresh from database
-        user.refresh_from_db()
-        profile.refresh_from_db()
+        # Neither model rewrites these fields on save, so one joined read checks both rows
+        stored = Profile.objects.values_list('user__first_name', 'company').get(pk=profile.pk)
         
-        self.assertEqual(user.first_name, 'Jane')
-        self.assertEqual(profile.company, 'New Company')
+        self.assertEqual(stored, ('Jane', 'New Company'))
+        with self.assertNumQueries(0):
+            self.assertEqual(profile.user.full_name, f'Jane {user.last_name}')
+
+
+class UserAndProfileMetaTests(SimpleTestCase):
+    """Test cases for User and Profile model options that need no database"""
+
+    def test_user_username_field(self):
+        """Test that EMAIL is the USERNAME_FIELD"""
+        self.assertEqual(User.USERNAME_FIELD, 'email')
+
+    def test_user_required_fields(self):
+        """Test REQUIRED_FIELDS setting"""
+        expected_fields = ['username', 'first_name', 'last_name']
+        self.assertEqual(User.REQUIRED_FIELDS, expected_fields)
 
     def test_user_meta_options(self):
         """Test User model meta options"""
@@ -318,10 +374,21 @@ class UserProfileIntegrationTests(BaseTestCase):
 
     def test_profile_meta_options(self):
         """Test Profile model doesn't have specific ordering"""
-        from users.models import Profile
         # Profile doesn't specify ordering, so it should be empty
         self.assertEqual(Profile._meta.ordering, [])
 
+    def test_upload_paths(self):
+        """Test that uploaded files are stored under their field's directory"""
+        upload_paths = [
+            (User, 'profile_picture', 'profile_pics/'),
+            (Profile, 'resume', 'resumes/'),
+        ]
+        for model, field_name, upload_to in upload_paths:
+            with self.subTest(field=field_name):
+                field = model._meta.get_field(field_name)
+                self.assertEqual(field.upload_to, upload_to)
+                self.assertTrue(field.generate_filename(None, 'file.jpg').startswith(upload_to))
+
 
 class UserModelManagerTests(BaseTestCase):
     """Test custom User model manager methods if any"""
@@ -362,7 +429,5 @@ class UserModelManagerTests(BaseTestCase):
 
     def test_user_manager_get_by_natural_key(self):
         """Test getting user by natural key (email)"""
-        user = UserFactory(email='natural@example.com')
-        
-        retrieved_user = User.objects.get_by_natural_key('natural@example.com')
-        self.assertEqual(user, retrieved_user)
+        retrieved_user = User.objects.get_by_natural_key(self.user.email)
+        self.assertEqual(self.user, retrieved_user)
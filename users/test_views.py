@@ -6,20 +6,37 @@ from django.test import TestCase, Client
 from django.urls import reverse
 from django.contrib.auth import get_user_model
 from django.contrib.messages import get_messages
+from django.core.cache import cache
+from django.db import connection
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.test.utils import override_settings
 from unittest.mock import patch, Mock
 
-from core.test_utils import BaseTestCase, EmailTestMixin, FileTestMixin, IntegrationTestCase
-from core.factories import UserFactory, ProfileFactory
+from core.test_utils import (
+    BaseTestCase, EmailTestMixin, FileTestMixin, IntegrationTestCase, cached_reverse
+)
+from core.factories import UserFactory, ProfileFactory, bulk_create_factory
+from .backends import EmailBackend
+from .models import Profile
+from .views import dashboard, edit_profile, profile_view, user_list
 
 User = get_user_model()
 
+LOCMEM_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
 
 class RegisterViewTests(BaseTestCase):
     """Test cases for user registration view"""
 
-    def setUp(self):
-        super().setUp()
-        self.register_url = reverse('users:register')
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.register_url = cached_reverse('users:register')
 
     def test_register_view_get(self):
         """Test GET request to registration page"""
@@ -43,14 +60,14 @@ class RegisterViewTests(BaseTestCase):
         response = self.client.post(self.register_url, data=form_data)
         
         # Should redirect to login after successful registration
-        self.assertRedirects(response, reverse('users:login'))
+        self.assertRedirects(response, cached_reverse('users:login'))
         
         # User should be created
         self.assertTrue(User.objects.filter(email='newuser@example.com').exists())
         
         # Success message should be displayed
-        user = User.objects.get(email='newuser@example.com')
-        self.assertEqual(user.username, 'newuser')
+        username = User.objects.values_list('username', flat=True).get(email='newuser@example.com')
+        self.assertEqual(username, 'newuser')
 
     def test_register_view_post_invalid_data(self):
         """Test POST request with invalid registration data"""
@@ -76,7 +93,7 @@ class RegisterViewTests(BaseTestCase):
         response = self.client.get(self.register_url)
         
         # Should redirect to home page
-        self.assertRedirects(response, reverse('portfolio:home'))
+        self.assertRedirects(response, cached_reverse('portfolio:home'))
 
     def test_register_view_creates_profile(self):
         """Test that registration creates associated profile"""
@@ -91,17 +108,17 @@ class RegisterViewTests(BaseTestCase):
         
         response = self.client.post(self.register_url, data=form_data)
         
-        user = User.objects.get(email='profile@example.com')
-        self.assertTrue(hasattr(user, 'profile'))
+        self.assertTrue(Profile.objects.filter(user__email='profile@example.com').exists())
 
 
 class LoginViewTests(BaseTestCase):
     """Test cases for user login view"""
 
-    def setUp(self):
-        super().setUp()
-        self.login_url = reverse('users:login')
-        self.test_user = UserFactory(email='login@example.com')
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.login_url = cached_reverse('users:login')
+        cls.test_user = UserFactory(email='login@example.com')
 
     def test_login_view_get(self):
         """Test GET request to login page"""
@@ -120,11 +137,10 @@ class LoginViewTests(BaseTestCase):
         response = self.client.post(self.login_url, data=form_data)
         
         # Should redirect to home page
-        self.assertRedirects(response, reverse('portfolio:home'))
+        self.assertRedirects(response, cached_reverse('portfolio:home'))
         
         # User should be logged in
-        user = User.objects.get(email='login@example.com')
-        self.assertEqual(int(self.client.session['_auth_user_id']), user.pk)
+        self.assertEqual(int(self.client.session['_auth_user_id']), self.test_user.pk)
 
     def test_login_view_post_invalid_credentials(self):
         """Test POST request with invalid login credentials"""
@@ -141,7 +157,7 @@ class LoginViewTests(BaseTestCase):
 
     def test_login_view_with_next_parameter(self):
         """Test login redirect with next parameter"""
-        next_url = reverse('users:dashboard')
+        next_url = cached_reverse('users:dashboard')
         login_url = f"{self.login_url}?next={next_url}"
         
         form_data = {
@@ -154,6 +170,27 @@ class LoginViewTests(BaseTestCase):
         # Should redirect to next URL
         self.assertRedirects(response, next_url)
 
+    def test_session_user_loaded_with_profile(self):
+        """Test that the per-request user lookup also loads the profile"""
+        profile = ProfileFactory(user=self.user)
+        
+        with self.assertNumQueries(1):
+            user = EmailBackend().get_user(self.user.pk)
+            self.assertEqual(user.profile, profile)
+
+    def test_login_view_ignores_offsite_next_parameter(self):
+        """Test that next URLs on other hosts fall back to the home page"""
+        form_data = {
+            'email': 'login@example.com',
+            'password': 'testpass123'
+        }
+        
+        for next_url in ('https://evil.example.com/', '//evil.example.com/'):
+            with self.subTest(next_url=next_url):
+                response = self.client.post(f'{self.login_url}?next={next_url}', data=form_data)
+                
+                self.assertRedirects(response, cached_reverse('portfolio:home'), fetch_redirect_response=False)
+
     def test_login_view_authenticated_user_redirect(self):
         """Test that authenticated users are redirected away from login"""
         self.login_user(self.test_user)
@@ -161,15 +198,16 @@ class LoginViewTests(BaseTestCase):
         response = self.client.get(self.login_url)
         
         # Should redirect to home page
-        self.assertRedirects(response, reverse('portfolio:home'))
+        self.assertRedirects(response, cached_reverse('portfolio:home'))
 
 
 class LogoutViewTests(BaseTestCase):
     """Test cases for user logout view"""
 
-    def setUp(self):
-        super().setUp()
-        self.logout_url = reverse('users:logout')
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.logout_url = cached_reverse('users:logout')
 
     def test_logout_view(self):
         """Test user logout"""
@@ -182,7 +220,7 @@ class LogoutViewTests(BaseTestCase):
         response = self.client.get(self.logout_url)
         
         # Should redirect to home page
-        self.assertRedirects(response, reverse('portfolio:home'))
+        self.assertRedirects(response, cached_reverse('portfolio:home'))
         
         # User should be logged out
         self.assertNotIn('_auth_user_id', self.client.session)
@@ -191,9 +229,10 @@ class LogoutViewTests(BaseTestCase):
 class ProfileViewTests(BaseTestCase):
     """Test cases for profile view"""
 
-    def setUp(self):
-        super().setUp()
-        self.profile_url = reverse('users:profile')
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.profile_url = cached_reverse('users:profile')
 
     def test_profile_view_own_profile(self):
         """Test viewing own profile"""
@@ -224,7 +263,7 @@ class ProfileViewTests(BaseTestCase):
         """Test viewing profile of nonexistent user"""
         self.login_user()
         
-        profile_url = reverse('users:profile_detail', kwargs={'username': 'nonexistent'})
+        profile_url = cached_reverse('users:profile_detail', username='nonexistent')
         response = self.client.get(profile_url)
         
         self.assertEqual(response.status_code, 404)
@@ -250,13 +289,38 @@ class ProfileViewTests(BaseTestCase):
         user.refresh_from_db()
         self.assertTrue(hasattr(user, 'profile'))
 
+    def test_profile_view_loads_other_user_profile_in_one_query(self):
+        """Test that another user's profile is joined into the user lookup"""
+        profile = ProfileFactory()
+        request = RequestFactory().get('/')
+        request.user = self.user
+        
+        with patch('users.views.render', return_value=HttpResponse()) as render:
+            with self.assertNumQueries(1):
+                profile_view(request, username=profile.user.username)
+        
+        self.assertEqual(render.call_args.args[2]['profile'], profile)
+
+    def test_profile_view_own_profile_in_one_query(self):
+        """Test that the signed-in user's profile costs a single lookup"""
+        profile = ProfileFactory(user=self.user)
+        request = RequestFactory().get('/')
+        request.user = User.objects.get(pk=self.user.pk)
+        
+        with patch('users.views.render', return_value=HttpResponse()) as render:
+            with self.assertNumQueries(1):
+                profile_view(request)
+        
+        self.assertEqual(render.call_args.args[2]['profile'], profile)
+
 
 class EditProfileViewTests(BaseTestCase, FileTestMixin):
     """Test cases for edit profile view"""
 
-    def setUp(self):
-        super().setUp()
-        self.edit_profile_url = reverse('users:edit_profile')
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.edit_profile_url = cached_reverse('users:edit_profile')
 
     def test_edit_profile_view_get(self):
         """Test GET request to edit profile page"""
@@ -269,6 +333,18 @@ class EditProfileViewTests(BaseTestCase, FileTestMixin):
         self.assertIn('user_form', response.context)
         self.assertIn('profile_form', response.context)
 
+    def test_edit_profile_view_get_in_one_query(self):
+        """Test that the edit forms are built from a single profile lookup"""
+        profile = ProfileFactory(user=self.user)
+        request = RequestFactory().get('/')
+        request.user = User.objects.get(pk=self.user.pk)
+        
+        with patch('users.views.render', return_value=HttpResponse()) as render:
+            with self.assertNumQueries(1):
+                edit_profile(request)
+        
+        self.assertEqual(render.call_args.args[2]['profile_form'].instance, profile)
+
     def test_edit_profile_view_post_valid_data(self):
         """Test POST request with valid profile data"""
         user = self.login_user()
@@ -291,7 +367,7 @@ class EditProfileViewTests(BaseTestCase, FileTestMixin):
         response = self.client.post(self.edit_profile_url, data=form_data)
         
         # Should redirect to profile page
-        self.assertRedirects(response, reverse('users:profile'))
+        self.assertRedirects(response, cached_reverse('users:profile'))
         
         # Data should be updated
         user.refresh_from_db()
@@ -349,7 +425,7 @@ class EditProfileViewTests(BaseTestCase, FileTestMixin):
             files=file_data
         )
         
-        self.assertRedirects(response, reverse('users:profile'))
+        self.assertRedirects(response, cached_reverse('users:profile'))
 
     def test_edit_profile_view_requires_login(self):
         """Test that edit profile view requires authentication"""
@@ -376,9 +452,14 @@ class EditProfileViewTests(BaseTestCase, FileTestMixin):
 class DashboardViewTests(BaseTestCase):
     """Test cases for user dashboard view"""
 
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.dashboard_url = cached_reverse('users:dashboard')
+
     def setUp(self):
         super().setUp()
-        self.dashboard_url = reverse('users:dashboard')
+        cache.clear()
 
     def test_dashboard_view_get(self):
         """Test GET request to dashboard page"""
@@ -417,18 +498,46 @@ class DashboardViewTests(BaseTestCase):
         self.assertTrue(len(response.context['recent_projects']) <= 5)
         self.assertTrue(len(response.context['recent_posts']) <= 5)
 
+    def test_dashboard_recent_activity_loaded_with_the_user(self):
+        """Test the profile and latest five projects and posts load in three queries"""
+        from core.factories import (
+            BlogCategoryFactory, CategoryFactory, PostFactory, ProjectFactory
+        )
+        
+        # A user of its own, and one category per kind so random category slugs can't collide
+        user = UserFactory()
+        profile = ProfileFactory(user=user)
+        category = CategoryFactory(name='Dashboard', slug='dashboard')
+        blog_category = BlogCategoryFactory(name='Dashboard', slug='dashboard')
+        for index in range(6):
+            ProjectFactory(user=user, category=category, slug=f'dashboard-project-{index}')
+        for index in range(2):
+            PostFactory(author=user, category=blog_category, slug=f'dashboard-post-{index}')
+        request = RequestFactory().get('/')
+        request.user = User.objects.get(pk=user.pk)
+        
+        with patch('users.views.render', return_value=HttpResponse()) as render:
+            with self.assertNumQueries(3):
+                dashboard(request)
+        
+        context = render.call_args.args[2]
+        self.assertEqual(context['profile'], profile)
+        self.assertEqual(len(context['recent_projects']), 5)
+        self.assertEqual(len(context['recent_posts']), 2)
+
 
 class UserListViewTests(BaseTestCase):
     """Test cases for user list view"""
 
-    def setUp(self):
-        super().setUp()
-        self.user_list_url = reverse('users:user_list')
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.user_list_url = cached_reverse('users:user_list')
 
     def test_user_list_view_get(self):
         """Test GET request to user list page"""
         # Create some users
-        users = [UserFactory() for _ in range(5)]
+        bulk_create_factory(UserFactory, 5)
         
         response = self.client.get(self.user_list_url)
         
@@ -459,7 +568,7 @@ class UserListViewTests(BaseTestCase):
     def test_user_list_view_pagination(self):
         """Test user list pagination"""
         # Create more users than page size (12)
-        users = [UserFactory() for _ in range(15)]
+        bulk_create_factory(UserFactory, 15)
         
         response = self.client.get(self.user_list_url)
         
@@ -477,6 +586,85 @@ class UserListViewTests(BaseTestCase):
         self.assertEqual(len(page_obj), 3)  # Remaining users
 
 
+class UserListQueryTests(BaseTestCase):
+    """Test cases for the user list queries"""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        if connection.features.can_return_rows_from_bulk_insert:
+            users = bulk_create_factory(UserFactory, 14)
+            Profile.objects.bulk_create([ProfileFactory.build(user=user) for user in users])
+        else:
+            for user in UserFactory.create_batch(14):
+                ProfileFactory(user=user)
+
+    def get_context(self, **params):
+        request = RequestFactory().get('/users/', params)
+        with patch('users.views.render', return_value=HttpResponse()) as render:
+            user_list(request)
+        return render.call_args.args[2]
+
+    def test_page_queries_do_not_grow_with_page_size(self):
+        """Test a page of users and their profiles loads in a count and one page query"""
+        with self.assertNumQueries(2):
+            page_obj = self.get_context()['page_obj']
+            # Users without a profile are joined too, so checking costs nothing either
+            profiles = [user.profile for user in page_obj if hasattr(user, 'profile')]
+        
+        self.assertTrue(profiles)
+        
+        self.assertEqual(len(page_obj), 12)
+
+    def test_search_page_queries_do_not_grow_with_page_size(self):
+        """Test a filtered page keeps the count and page query budget"""
+        with self.assertNumQueries(2):
+            page_obj = self.get_context(q='a')['page_obj']
+            for user in page_obj:
+                user.full_name
+
+    @override_settings(CACHES=LOCMEM_CACHES)
+    def test_count_cached_between_page_loads(self):
+        """Test that paging through the same listing reuses the cached user count"""
+        cache.clear()
+        total = self.get_context()['page_obj'].paginator.count
+        
+        # Only the page itself is fetched; the count comes from the cache
+        with self.assertNumQueries(1):
+            page_obj = self.get_context(page=2)['page_obj']
+            self.assertEqual(len(page_obj), total - 12)
+
+    @override_settings(CACHES=LOCMEM_CACHES)
+    def test_search_results_cached_between_requests(self):
+        """Test that repeating a search only loads the requested page"""
+        cache.clear()
+        UserFactory(first_name='Zebediah')
+        first = list(self.get_context(q='zebed')['page_obj'])
+        
+        with self.assertNumQueries(1):
+            page_obj = self.get_context(q='zebed')['page_obj']
+            self.assertEqual(list(page_obj), first)
+        self.assertEqual(page_obj.paginator.count, 1)
+
+    @override_settings(CACHES=LOCMEM_CACHES)
+    def test_user_changes_invalidate_cached_search(self):
+        """Test that adding or deactivating a user refreshes cached search pages"""
+        cache.clear()
+        UserFactory(first_name='Zebediah')
+        self.get_context(q='zebed')
+        
+        second = UserFactory(first_name='Zebedee')
+        page_obj = self.get_context(q='zebed')['page_obj']
+        self.assertEqual(page_obj.paginator.count, 2)
+        self.assertIn(second, list(page_obj))
+        
+        second.is_active = False
+        second.save()
+        page_obj = self.get_context(q='zebed')['page_obj']
+        self.assertEqual(page_obj.paginator.count, 1)
+        self.assertNotIn(second, list(page_obj))
+
+
 class UserViewIntegrationTests(IntegrationTestCase):
     """Integration tests for user views working together"""
 
@@ -492,8 +680,8 @@ class UserViewIntegrationTests(IntegrationTestCase):
             'password2': 'complexpassword123'
         }
         
-        response = self.client.post(reverse('users:register'), data=registration_data)
-        self.assertRedirects(response, reverse('users:login'))
+        response = self.client.post(cached_reverse('users:register'), data=registration_data)
+        self.assertRedirects(response, cached_reverse('users:login'))
         
         # Step 2: Login
         login_data = {
@@ -501,11 +689,11 @@ class UserViewIntegrationTests(IntegrationTestCase):
             'password': 'complexpassword123'
         }
         
-        response = self.client.post(reverse('users:login'), data=login_data)
-        self.assertRedirects(response, reverse('portfolio:home'))
+        response = self.client.post(cached_reverse('users:login'), data=login_data)
+        self.assertRedirects(response, cached_reverse('portfolio:home'))
         
         # Step 3: Access dashboard
-        response = self.client.get(reverse('users:dashboard'))
+        response = self.client.get(cached_reverse('users:dashboard'))
         self.assertEqual(response.status_code, 200)
         
         # Step 4: Edit profile
@@ -521,11 +709,11 @@ class UserViewIntegrationTests(IntegrationTestCase):
             'is_available_for_hire': True
         }
         
-        response = self.client.post(reverse('users:edit_profile'), data=profile_data)
-        self.assertRedirects(response, reverse('users:profile'))
+        response = self.client.post(cached_reverse('users:edit_profile'), data=profile_data)
+        self.assertRedirects(response, cached_reverse('users:profile'))
         
         # Step 5: View updated profile
-        response = self.client.get(reverse('users:profile'))
+        response = self.client.get(cached_reverse('users:profile'))
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, 'This is my bio')
         self.assertContains(response, 'Test Company')
@@ -542,14 +730,14 @@ class UserViewIntegrationTests(IntegrationTestCase):
         self.login_user(user1)
         
         # View own profile
-        response = self.client.get(reverse('users:profile'))
+        response = self.client.get(cached_reverse('users:profile'))
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, 'Company 1')
         self.assertTrue(response.context['is_own_profile'])
         
         # View other user's profile
         response = self.client.get(
-            reverse('users:profile_detail', kwargs={'username': 'user2'})
+            cached_reverse('users:profile_detail', username='user2')
         )
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, 'Company 2')
@@ -558,11 +746,11 @@ class UserViewIntegrationTests(IntegrationTestCase):
     def test_authentication_flow_with_redirects(self):
         """Test authentication flow with proper redirects"""
         # Try to access protected page without login
-        dashboard_url = reverse('users:dashboard')
+        dashboard_url = cached_reverse('users:dashboard')
         response = self.client.get(dashboard_url)
         
         # Should redirect to login with next parameter
-        login_url = reverse('users:login')
+        login_url = cached_reverse('users:login')
         expected_redirect = f"{login_url}?next={dashboard_url}"
         self.assertRedirects(response, expected_redirect)
         
@@ -1,57 +1,66 @@
+import hashlib
+import time
+from functools import wraps
+
 from django.shortcuts import render, redirect, get_object_or_404
-from django.contrib.auth import login, authenticate, logout
+from django.contrib.auth import login, logout
 from django.contrib.auth.decorators import login_required
-from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib import messages
-from django.views.generic import CreateView, DetailView, UpdateView
-from django.urls import reverse_lazy
-from django.core.paginator import Paginator
-from django.db.models import Q
+from django.core.cache import cache
+from django.db.models import Q, Prefetch
+from django.http import HttpResponseRedirect
+from django.utils.http import url_has_allowed_host_and_scheme
+from core.paginator import CachedCountPaginator
+from blog.models import Post
+from portfolio.models import Project
 from .models import User, Profile
 from .forms import UserRegistrationForm, UserLoginForm, UserUpdateForm, ProfileUpdateForm
+from .cache_keys import USER_SEARCH_CACHE_PREFIX, USER_SEARCH_CACHE_TIMEOUT, USER_LIST_CACHE_VERSION_KEY
+
+
+def redirect_if_authenticated(to):
+    """Send signed-in users to ``to`` before the wrapped view runs"""
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            if request.user.is_authenticated:
+                return redirect(to)
+            return view_func(request, *args, **kwargs)
+        return wrapper
+    return decorator
 
 
-class RegisterView(CreateView):
+@redirect_if_authenticated('portfolio:home')
+def register_view(request):
     """User registration view"""
-    model = User
-    form_class = UserRegistrationForm
-    template_name = 'users/register.html'
-    success_url = reverse_lazy('users:login')
-    
-    def form_valid(self, form):
-        response = super().form_valid(form)
-        messages.success(self.request, 'Registration successful! You can now log in.')
-        return response
+    if request.method == 'POST':
+        form = UserRegistrationForm(request.POST)
+        if form.is_valid():
+            form.save()
+            messages.success(request, 'Registration successful! You can now log in.')
+            return redirect('users:login')
+    else:
+        form = UserRegistrationForm()
     
-    def dispatch(self, request, *args, **kwargs):
-        if request.user.is_authenticated:
-            return redirect('portfolio:home')
-        return super().dispatch(request, *args, **kwargs)
+    return render(request, 'users/register.html', {'form': form})
 
 
+@redirect_if_authenticated('portfolio:home')
 def login_view(request):
     """Custom login view"""
-    if request.user.is_authenticated:
-        return redirect('portfolio:home')
-    
     if request.method == 'POST':
-        form = UserLoginForm(request.POST)
+        form = UserLoginForm(request.POST, request=request)
         if form.is_valid():
-            email = form.cleaned_data['email']
-            password = form.cleaned_data['password']
-            
-            try:
-                user = User.objects.get(email=email)
-                user = authenticate(request, username=user.username, password=password)
-                if user:
-                    login(request, user)
-                    messages.success(request, f'Welcome back, {user.first_name}!')
-                    next_page = request.GET.get('next', 'portfolio:home')
-                    return redirect(next_page)
-            except User.DoesNotExist:
-                pass
-            
-            messages.error(request, 'Invalid email or password.')
+            user = form.get_user()
+            login(request, user)
+            messages.success(request, f'Welcome back, {user.first_name}!')
+            # Only follow next= to this site, and skip redirect()'s reverse() attempt on paths
+            next_page = request.GET.get('next') or request.POST.get('next')
+            if next_page and url_has_allowed_host_and_scheme(
+                next_page, allowed_hosts={request.get_host()}, require_https=request.is_secure()
+            ):
+                return HttpResponseRedirect(next_page)
+            return redirect('portfolio:home')
     else:
         form = UserLoginForm()
     
@@ -65,15 +74,23 @@ def logout_view(request):
     return redirect('portfolio:home')
 
 
+def get_user_profile(user):
+    """Return the user's profile, creating it for users added outside registration"""
+    try:
+        return user.profile
+    except Profile.DoesNotExist:
+        return Profile.objects.create(user=user)
+
+
 @login_required
 def profile_view(request, username=None):
     """View user profile"""
     if username:
-        user = get_object_or_404(User, username=username)
+        user = get_object_or_404(User.objects.select_related('profile'), username=username)
     else:
         user = request.user
     
-    profile, created = Profile.objects.get_or_create(user=user)
+    profile = get_user_profile(user)
     
     context = {
         'profile_user': user,
@@ -86,7 +103,7 @@ def profile_view(request, username=None):
 @login_required
 def edit_profile(request):
     """Edit user profile"""
-    profile, created = Profile.objects.get_or_create(user=request.user)
+    profile = get_user_profile(request.user)
     
     if request.method == 'POST':
         user_form = UserUpdateForm(request.POST, request.FILES, instance=request.user)
@@ -111,16 +128,16 @@ def edit_profile(request):
 @login_required
 def dashboard(request):
     """User dashboard"""
-    profile, created = Profile.objects.get_or_create(user=request.user)
-    
-    # Get user's recent activity (you can customize this)
-    recent_projects = request.user.project_set.all()[:5] if hasattr(request.user, 'project_set') else []
-    recent_posts = request.user.post_set.all()[:5] if hasattr(request.user, 'post_set') else []
+    # Load the profile with the user and the recent activity as one prefetch chain
+    user = User.objects.select_related('profile').prefetch_related(
+        Prefetch('projects', queryset=Project.objects.all()[:5], to_attr='recent_projects'),
+        Prefetch('posts', queryset=Post.objects.all()[:5], to_attr='recent_posts'),
+    ).get(pk=request.user.pk)
     
     context = {
-        'profile': profile,
-        'recent_projects': recent_projects,
-        'recent_posts': recent_posts,
+        'profile': get_user_profile(user),
+        'recent_projects': user.recent_projects,
+        'recent_posts': user.recent_posts,
     }
     return render(request, 'users/dashboard.html', context)
 
@@ -128,7 +145,10 @@ def dashboard(request):
 def user_list(request):
     """List all users with search functionality"""
     query = request.GET.get('q', '')
-    users = User.objects.filter(is_active=True).order_by('-created_at')
+    page_number = request.GET.get('page')
+    # Cards show profile details, so join the profile into the page query
+    active_users = User.objects.filter(is_active=True).select_related('profile')
+    users = active_users.order_by('-created_at')
     
     if query:
         users = users.filter(
@@ -138,10 +158,26 @@ def user_list(request):
             Q(bio__icontains=query)
         )
     
-    paginator = Paginator(users, 12)  # Show 12 users per page
-    page_number = request.GET.get('page')
+    # Show 12 users per page; the total is cached so paging skips the COUNT
+    version = cache.get_or_set(USER_LIST_CACHE_VERSION_KEY, time.time_ns, None)
+    paginator = CachedCountPaginator(
+        users, 12, cache_timeout=60, cache_prefix=f'user_list_count:{version}'
+    )
     page_obj = paginator.get_page(page_number)
     
+    if query:
+        # Repeated searches reuse this page's matching ids and skip the search scan
+        digest = hashlib.md5(query.encode(), usedforsecurity=False).hexdigest()
+        cache_key = f'{USER_SEARCH_CACHE_PREFIX}:{version}:{digest}:{page_obj.number}'
+        user_ids = cache.get(cache_key)
+        if user_ids is None:
+            page_obj.object_list = list(page_obj.object_list)
+            cache.set(cache_key, [user.pk for user in page_obj.object_list], USER_SEARCH_CACHE_TIMEOUT)
+        else:
+            # Hydrate just this page, keeping the cached order
+            page_users = active_users.in_bulk(user_ids)
+            page_obj.object_list = [page_users[pk] for pk in user_ids if pk in page_users]
+    
     context = {
         'page_obj': page_obj,
         'query': query,